@@ -4,17 +4,44 @@ Chaos Monkey - A simple chaos engineering tool to test system resilience
 This implementation simulates various failure scenarios to test application robustness.
 """
 
-import random
 import time
 import threading
 import logging
+import logging.handlers
+import atexit
+import queue
 import psutil
 import requests
 import os
 import signal
+import tempfile
+import math
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Callable
 from dataclasses import dataclass
 from enum import Enum
+import numpy as np
+from numba import njit, prange, set_num_threads, config as numba_config
+
+
+@njit('float64(int64, int64)', parallel=True, nogil=True, cache=True)
+def _stress(cores, iters):
+    """Spin `cores` worker threads for `iters` iterations each without the GIL"""
+    total = 0.0
+    for c in prange(cores):
+        acc = 0.0
+        for i in range(iters):
+            acc += math.sin(i) * math.cos(i)
+        # Accumulate into the return value so LLVM cannot drop the loop as dead code
+        total += acc
+    return total
+
+# Load the compiled kernel and spin up Numba's thread pool before the first experiment
+_stress(1, 1)
+# Numba's default workqueue threading layer aborts on concurrent parallel calls,
+# so overlapping CPU stress experiments take turns on the one pool
+_stress_lock = threading.Lock()
 
 
 class ChaosType(Enum):
@@ -38,6 +65,10 @@ class ChaosExperiment:
     parameters: Dict = None
 
 
+# Small integer code per chaos type, used to index ChaosMonkey's handler table
+_CHAOS_TYPE_CODES = {chaos_type: code for code, chaos_type in enumerate(ChaosType)}
+
+
 class ChaosMonkey:
     """
     Main Chaos Monkey class that orchestrates chaos experiments
@@ -46,40 +77,109 @@ class ChaosMonkey:
     def __init__(self, config_file: str = None):
         self.experiments: List[ChaosExperiment] = []
         self.running = False
-        self.threads: List[threading.Thread] = []
+        # Set by stop(); waiting on it instead of sleeping makes shutdown immediate
+        self._stop = threading.Event()
+        # Experiments that fire in the same round run side by side on this pool
+        self._pool: ThreadPoolExecutor = None
+        # Held by stop() while it drains the pool, so concurrent stops don't race past it
+        self._stop_lock = threading.Lock()
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('chaos_monkey.log'),
-                logging.StreamHandler()
-            ]
-        )
+        # Structure-of-arrays view of self.experiments so each tick's
+        # probability checks are one vectorised draw
+        self._count = 0
+        self._types = np.empty(0, dtype=np.int8)
+        self._probs = np.empty(0, dtype=np.float32)
+        self._rng = np.random.default_rng()
+        # Running total of the probabilities for weighted mode; rebuilt lazily after add_experiment
+        self._cum = None
+        
+        # Handler for each chaos type; new experiment types only need an entry here
+        dispatch: Dict[ChaosType, Callable[[ChaosExperiment], None]] = {
+            ChaosType.CPU_STRESS: self._cpu_stress,
+            ChaosType.MEMORY_STRESS: self._memory_stress,
+            ChaosType.NETWORK_LATENCY: self._network_latency,
+            ChaosType.SERVICE_KILL: self._service_kill,
+            ChaosType.DISK_FILL: self._disk_fill,
+            ChaosType.PROCESS_HANG: self._process_hang
+        }
+        # The same handlers indexed by _CHAOS_TYPE_CODES, for the scheduler's array lookups
+        self._handlers = tuple(dispatch.get(chaos_type) for chaos_type in ChaosType)
+        
+        # Setup logging: workers only enqueue records, and a single listener
+        # thread formats and writes them to the file and the console
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler('chaos_monkey.log')
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
         self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                self.logger.removeHandler(handler)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+        self._listener_lock = threading.Lock()
+        self._listening = False
+        self._start_listener()
+        # The listener thread is a daemon, so flush it at exit when stop() was never called
+        atexit.register(self._stop_listener)
         
     def add_experiment(self, experiment: ChaosExperiment):
         """Add a chaos experiment to the queue"""
+        if self._count == len(self._probs):
+            capacity = max(8, 2 * self._count)
+            self._types = np.resize(self._types, capacity)
+            self._probs = np.resize(self._probs, capacity)
+        
+        self._types[self._count] = _CHAOS_TYPE_CODES[experiment.chaos_type]
+        self._probs[self._count] = experiment.probability
+        self._count += 1
+        self._cum = None
         self.experiments.append(experiment)
         self.logger.info(f"Added experiment: {experiment.name}")
     
-    def start(self, interval: int = 30):
-        """Start the chaos monkey with specified interval between experiments"""
+    def start(self, interval: int = 30, mode: str = "independent"):
+        """Start the chaos monkey with specified interval between experiments
+        
+        In "independent" mode every experiment passing its probability check
+        fires each round; in "weighted" mode exactly one experiment fires per
+        round, chosen with probability proportional to its `probability`.
+        """
+        if mode not in ("independent", "weighted"):
+            raise ValueError(f"Unknown scheduling mode: {mode}")
+        
         self.running = True
-        self.logger.info("🐒 Chaos Monkey started!")
+        self._stop.clear()
+        self._start_listener()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(4, psutil.cpu_count()),
+            thread_name_prefix="chaos"
+        )
+        self.logger.info(f"🐒 Chaos Monkey started! ({mode} mode)")
         
         try:
-            while self.running:
-                if self.experiments:
-                    experiment = random.choice(self.experiments)
-                    if random.random() < experiment.probability:
-                        self.logger.info(f"🔥 Executing chaos experiment: {experiment.name}")
-                        self._execute_experiment(experiment)
+            while not self._stop.is_set():
+                if self._count:
+                    if mode == "weighted":
+                        indices = self._pick_weighted()
+                    else:
+                        # One Bernoulli trial per experiment; everything that fires runs this round
+                        fired = self._rng.random(self._count) < self._probs[:self._count]
+                        indices = np.flatnonzero(fired)
+                    
+                    if len(indices):
+                        for index in indices:
+                            self.logger.info(f"🔥 Executing chaos experiment: {self.experiments[index].name}")
+                            self._pool.submit(self._execute_indexed, index)
                     else:
-                        self.logger.info(f"⚡ Skipping experiment {experiment.name} (probability check)")
+                        self.logger.info("⚡ Skipping this round (no experiment passed its probability check)")
                 
-                time.sleep(interval)
+                if self._stop.wait(interval):
+                    break
                 
         except KeyboardInterrupt:
             self.logger.info("🛑 Chaos Monkey stopped by user")
@@ -87,31 +187,56 @@ class ChaosMonkey:
             self.stop()
     
     def stop(self):
-        """Stop the chaos monkey and cleanup"""
+        """Stop the chaos monkey and cleanup
+        
+        Safe to call more than once: later callers wait for the first to finish
+        draining the pool, and only that first call logs and stops the listener.
+        """
         self.running = False
-        for thread in self.threads:
-            if thread.is_alive():
-                thread.join(timeout=5)
-        self.logger.info("🐒 Chaos Monkey stopped")
+        self._stop.set()
+        with self._stop_lock:
+            pool, self._pool = self._pool, None
+            if pool is None:
+                return
+            pool.shutdown(wait=True, cancel_futures=True)
+            self.logger.info("🐒 Chaos Monkey stopped")
+            
+            self._stop_listener()
+    
+    def _start_listener(self):
+        """Start the log listener thread unless it is already running"""
+        with self._listener_lock:
+            if not self._listening:
+                self._listener.start()
+                self._listening = True
     
-    def _execute_experiment(self, experiment: ChaosExperiment):
-        """Execute a specific chaos experiment"""
+    def _stop_listener(self):
+        """Flush whatever is still queued, then stop the log listener thread"""
+        with self._listener_lock:
+            if self._listening:
+                self._listening = False
+                self._listener.stop()
+    
+    def _pick_weighted(self) -> np.ndarray:
+        """Draw one experiment index with probability proportional to its weight"""
+        if self._cum is None:
+            self._cum = np.cumsum(self._probs[:self._count], dtype=np.float64)
+        total = self._cum[-1]
+        if total <= 0:
+            return self._cum[:0].astype(np.intp)
+        index = np.searchsorted(self._cum, self._rng.random() * total, side='right')
+        # random() * total can round up to exactly total, which would search past the end
+        return np.array([min(index, self._count - 1)], dtype=np.intp)
+    
+    def _execute_indexed(self, index: int):
+        """Execute the experiment at `index` through the handler table"""
+        experiment = self.experiments[index]
         try:
-            if experiment.chaos_type == ChaosType.CPU_STRESS:
-                self._cpu_stress(experiment)
-            elif experiment.chaos_type == ChaosType.MEMORY_STRESS:
-                self._memory_stress(experiment)
-            elif experiment.chaos_type == ChaosType.NETWORK_LATENCY:
-                self._network_latency(experiment)
-            elif experiment.chaos_type == ChaosType.SERVICE_KILL:
-                self._service_kill(experiment)
-            elif experiment.chaos_type == ChaosType.DISK_FILL:
-                self._disk_fill(experiment)
-            elif experiment.chaos_type == ChaosType.PROCESS_HANG:
-                self._process_hang(experiment)
+            handler = self._handlers[self._types[index]]
+            if handler:
+                handler(experiment)
             else:
                 self.logger.warning(f"Unknown chaos type: {experiment.chaos_type}")
-                
         except Exception as e:
             self.logger.error(f"Error executing experiment {experiment.name}: {str(e)}")
     
@@ -119,25 +244,17 @@ class ChaosMonkey:
         """Simulate high CPU usage"""
         self.logger.info(f"🔥 Starting CPU stress for {experiment.duration} seconds")
         
-        def cpu_burn():
-            end_time = time.time() + experiment.duration
-            while time.time() < end_time and self.running:
-                # Busy wait to consume CPU
-                for _ in range(1000000):
-                    pass
-        
-        # Start multiple threads to stress CPU
         num_cores = experiment.parameters.get('cores', 2) if experiment.parameters else 2
-        threads = []
-        
-        for _ in range(num_cores):
-            thread = threading.Thread(target=cpu_burn)
-            thread.start()
-            threads.append(thread)
+        # SMT siblings share execution units, so stressing more than the physical cores adds nothing
+        physical_cores = psutil.cpu_count(logical=False) or num_cores
+        num_cores = max(1, min(num_cores, physical_cores, numba_config.NUMBA_NUM_THREADS))
         
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        # Numba keeps its worker pool alive between calls, so no threads are created per experiment
+        end_time = time.monotonic() + experiment.duration
+        with _stress_lock:
+            set_num_threads(num_cores)
+            while time.monotonic() < end_time and not self._stop.is_set():
+                _stress(num_cores, 5_000_000)
         
         self.logger.info("✅ CPU stress experiment completed")
     
@@ -146,19 +263,17 @@ class ChaosMonkey:
         mb_to_allocate = experiment.parameters.get('mb', 100) if experiment.parameters else 100
         self.logger.info(f"🧠 Allocating {mb_to_allocate}MB of memory for {experiment.duration} seconds")
         
-        # Allocate memory
-        memory_hog = []
+        # Allocate one anonymous mapping and touch a byte per page so it is really resident
+        memory_hog = mmap.mmap(-1, mb_to_allocate << 20)
         try:
-            for _ in range(mb_to_allocate):
-                # Allocate 1MB chunks
-                chunk = bytearray(1024 * 1024)
-                memory_hog.append(chunk)
+            for offset in range(0, len(memory_hog), mmap.PAGESIZE):
+                memory_hog[offset] = 1
             
-            time.sleep(experiment.duration)
+            self._stop.wait(experiment.duration)
             
         finally:
             # Clean up memory
-            memory_hog.clear()
+            memory_hog.close()
             self.logger.info("✅ Memory stress experiment completed")
     
     def _network_latency(self, experiment: ChaosExperiment):
@@ -168,7 +283,7 @@ class ChaosMonkey:
         
         # In a real implementation, this would inject latency into network calls
         # For demo purposes, we'll just simulate the delay
-        time.sleep(experiment.duration)
+        self._stop.wait(experiment.duration)
         self.logger.info("✅ Network latency experiment completed")
     
     def _service_kill(self, experiment: ChaosExperiment):
@@ -179,7 +294,7 @@ class ChaosMonkey:
         # In a real implementation, this would actually kill processes
         # For demo purposes, we'll just log the action
         self.logger.warning(f"🔥 Service {service_name} would be terminated here")
-        time.sleep(2)  # Simulate service restart time
+        self._stop.wait(2)  # Simulate service restart time
         self.logger.info(f"🔄 Service {service_name} restarted")
     
     def _disk_fill(self, experiment: ChaosExperiment):
@@ -187,18 +302,25 @@ class ChaosMonkey:
         size_mb = experiment.parameters.get('size_mb', 10) if experiment.parameters else 10
         self.logger.info(f"💾 Creating temporary file of {size_mb}MB for {experiment.duration} seconds")
         
-        temp_file = "/tmp/chaos_monkey_temp.dat"
+        # A unique file per experiment so overlapping disk fills don't remove each other's files
+        fd, temp_file = tempfile.mkstemp(prefix="chaos_monkey_", suffix=".dat")
         try:
-            # Create a temporary file
-            with open(temp_file, "wb") as f:
-                f.write(b"0" * (size_mb * 1024 * 1024))
+            # Reserve the blocks in the kernel instead of writing a zero buffer from Python
+            with os.fdopen(fd, "wb") as f:
+                if hasattr(os, "posix_fallocate"):
+                    os.posix_fallocate(f.fileno(), 0, size_mb * 1024 * 1024)
+                else:
+                    # macOS has no posix_fallocate and ftruncate only makes a sparse file,
+                    # so write real blocks from one reused 1 MiB zero buffer
+                    chunk = bytes(1024 * 1024)
+                    for _ in range(size_mb):
+                        f.write(chunk)
             
-            time.sleep(experiment.duration)
+            self._stop.wait(experiment.duration)
             
         finally:
             # Clean up
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            os.remove(temp_file)
             self.logger.info("✅ Disk fill experiment completed")
     
     def _process_hang(self, experiment: ChaosExperiment):
@@ -206,7 +328,7 @@ class ChaosMonkey:
         self.logger.info(f"⏸️ Simulating process hang for {experiment.duration} seconds")
         
         # Simulate a hanging process
-        time.sleep(experiment.duration)
+        self._stop.wait(experiment.duration)
         self.logger.info("✅ Process hang experiment completed")
 
 
@@ -4,13 +4,18 @@ Sample Web Application for Chaos Monkey Testing
 This is a simple Flask application that demonstrates resilience patterns.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 import time
-import random
 import threading
 import logging
+import signal
+import itertools
+from collections import deque
 from datetime import datetime
 import psutil
+import numpy as np
+import orjson
+from numba import njit
 
 
 app = Flask(__name__)
@@ -19,6 +24,29 @@ app = Flask(__name__)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@njit('int64(int64)', cache=True, nogil=True)
+def _sq_sum(n):
+    """Sum of squares below n, compiled so the worker thread releases the GIL"""
+    s = 0
+    for i in range(n):
+        s += i * i
+    return s
+
+# Load the compiled kernel at import so gunicorn workers are warm before their first request
+_sq_sum(1)
+
+
+# One PCG64 generator per worker thread, so request threads never contend on a shared RNG
+_tls = threading.local()
+
+
+def _rng() -> np.random.Generator:
+    """Return the calling thread's random generator, creating it on first use"""
+    r = getattr(_tls, 'r', None)
+    if r is None:
+        r = _tls.r = np.random.default_rng()
+    return r
+
 # Application state
 app_state = {
     'start_time': datetime.now(),
@@ -27,41 +55,121 @@ app_state = {
     'health_status': 'healthy'
 }
 
+# next() on itertools.count never hands out the same value twice, but another thread can
+# store its later value before ours lands, so the draw and the store into app_state happen
+# together under _count_lock and readers never see a count go backwards
+_request_counter = itertools.count(1)
+_error_counter = itertools.count(1)
+_count_lock = threading.Lock()
+
+
+def _count_request() -> int:
+    """Record one request and return the new total"""
+    with _count_lock:
+        app_state['request_count'] = count = next(_request_counter)
+    return count
+
+
+def _count_error() -> int:
+    """Record one error and return the new total"""
+    with _count_lock:
+        app_state['error_count'] = count = next(_error_counter)
+    return count
+
+# Seconds between runs of the health-recovery background task
+BACKGROUND_INTERVAL = 30
+
+# Set on SIGTERM so background threads and simulated-latency waits return early
+_shutdown = threading.Event()
+
+# System metrics are sampled every half second by metrics_sampler(); when the
+# sampler isn't running (e.g. under gunicorn) requests refresh them at most once per second
+SAMPLER_INTERVAL = 0.5
+SYSINFO_TTL = 1.0
+_sys_cache = {'t': 0.0, 'v': None}
+_sys_lock = threading.Lock()
+
+# cpu_percent(None) reports usage since the previous call, so prime it once at import
+psutil.cpu_percent(None)
+
+
+def _refresh_sysinfo():
+    """Sample psutil into the shared cache; callers hold _sys_lock"""
+    _sys_cache['v'] = (
+        psutil.cpu_percent(None),
+        psutil.virtual_memory().percent,
+        psutil.disk_usage('/').percent
+    )
+    _sys_cache['t'] = time.monotonic()
+
+
+def sysinfo():
+    """Return cached (cpu_percent, memory_percent, disk_percent)"""
+    if time.monotonic() - _sys_cache['t'] > SYSINFO_TTL:
+        with _sys_lock:
+            if time.monotonic() - _sys_cache['t'] > SYSINFO_TTL:
+                _refresh_sysinfo()
+    return _sys_cache['v']
+
+
+def metrics_sampler():
+    """Keep the system metrics cache fresh so request handlers never call psutil"""
+    while not _shutdown.wait(SAMPLER_INTERVAL):
+        try:
+            with _sys_lock:
+                _refresh_sysinfo()
+        except Exception as e:
+            logger.error(f"Metrics sampler error: {e}")
+
+
+def ojson(obj, status=200):
+    """jsonify() replacement for hot endpoints; orjson also serialises NumPy arrays natively"""
+    return Response(
+        orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+# The home payload only varies in uptime and request count, so the rest is encoded once
+_HOME_PREFIX = b'{"message":"Welcome to Chaos Monkey Demo App","status":"running","uptime":"'
+
 
 @app.route('/')
 def home():
     """Home endpoint"""
-    app_state['request_count'] += 1
-    return jsonify({
-        'message': 'Welcome to Chaos Monkey Demo App',
-        'status': 'running',
-        'uptime': str(datetime.now() - app_state['start_time']),
-        'requests_served': app_state['request_count']
-    })
+    count = _count_request()
+    uptime = str(datetime.now() - app_state['start_time'])
+    return Response(
+        b''.join((_HOME_PREFIX, uptime.encode(), b'","requests_served":', str(count).encode(), b'}')),
+        mimetype='application/json'
+    )
 
 
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    app_state['request_count'] += 1
+    _count_request()
+    
+    cpu_usage, memory_usage, _ = sysinfo()
     
     # Simulate occasional health issues
-    if random.random() < 0.1:  # 10% chance of health issue
+    if _rng().random() < 0.1:  # 10% chance of health issue
         app_state['health_status'] = 'degraded'
-        return jsonify({
+        return ojson({
             'status': 'degraded',
             'timestamp': datetime.now().isoformat(),
-            'cpu_usage': psutil.cpu_percent(),
-            'memory_usage': psutil.virtual_memory().percent
-        }), 503
+            'cpu_usage': cpu_usage,
+            'memory_usage': memory_usage
+        }, 503)
     
     app_state['health_status'] = 'healthy'
-    return jsonify({
+    return ojson({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
         'uptime': str(datetime.now() - app_state['start_time']),
-        'cpu_usage': psutil.cpu_percent(),
-        'memory_usage': psutil.virtual_memory().percent,
+        'cpu_usage': cpu_usage,
+        'memory_usage': memory_usage,
         'requests_served': app_state['request_count'],
         'error_count': app_state['error_count']
     })
@@ -70,37 +178,37 @@ def health_check():
 @app.route('/api/data')
 def get_data():
     """API endpoint that simulates data retrieval"""
-    app_state['request_count'] += 1
+    _count_request()
     
     # Simulate processing time
-    processing_time = random.uniform(0.1, 0.5)
-    time.sleep(processing_time)
+    processing_time = _rng().uniform(0.1, 0.5)
+    _shutdown.wait(processing_time)
     
     # Simulate occasional errors
-    if random.random() < 0.05:  # 5% error rate
-        app_state['error_count'] += 1
-        return jsonify({'error': 'Service temporarily unavailable'}), 500
+    if _rng().random() < 0.05:  # 5% error rate
+        _count_error()
+        return ojson({'error': 'Service temporarily unavailable'}, 500)
     
     # Return mock data
     data = {
-        'id': random.randint(1, 1000),
+        'id': int(_rng().integers(1, 1001)),
         'timestamp': datetime.now().isoformat(),
         'processing_time': processing_time,
-        'data': [random.randint(1, 100) for _ in range(10)]
+        'data': _rng().integers(1, 101, 10, dtype=np.int32)
     }
     
-    return jsonify(data)
+    return ojson(data)
 
 
 @app.route('/api/slow')
 def slow_endpoint():
     """Endpoint that simulates slow processing"""
-    app_state['request_count'] += 1
+    _count_request()
     
     # Simulate slow processing (2-5 seconds)
-    delay = random.uniform(2, 5)
+    delay = _rng().uniform(2, 5)
     logger.info(f"Processing slow request with {delay:.2f}s delay")
-    time.sleep(delay)
+    _shutdown.wait(delay)
     
     return jsonify({
         'message': 'Slow operation completed',
@@ -112,41 +220,28 @@ def slow_endpoint():
 @app.route('/api/memory-intensive')
 def memory_intensive():
     """Endpoint that uses significant memory"""
-    app_state['request_count'] += 1
-    
-    # Allocate some memory temporarily
-    large_data = []
-    try:
-        for i in range(1000):
-            large_data.append([random.random() for _ in range(1000)])
-        
-        # Process the data
-        result = sum(sum(row) for row in large_data)
-        
-        return jsonify({
-            'message': 'Memory intensive operation completed',
-            'result': result,
-            'memory_allocated': '~8MB',
-            'timestamp': datetime.now().isoformat()
-        })
-    
-    finally:
-        # Clean up memory
-        large_data.clear()
+    _count_request()
+    
+    # Allocate a contiguous 1000x1000 float64 block (~8MB) and reduce it in C
+    large_data = _rng().random((1000, 1000))
+    result = float(large_data.sum())
+    
+    return jsonify({
+        'message': 'Memory intensive operation completed',
+        'result': result,
+        'memory_allocated': '~8MB',
+        'timestamp': datetime.now().isoformat()
+    })
 
 
 @app.route('/api/cpu-intensive')
 def cpu_intensive():
     """Endpoint that performs CPU-intensive operations"""
-    app_state['request_count'] += 1
+    _count_request()
     
     # Perform CPU-intensive calculation
     start_time = time.time()
-    result = 0
-    
-    for i in range(1000000):
-        result += i ** 2
-    
+    result = _sq_sum(1000000)
     processing_time = time.time() - start_time
     
     return jsonify({
@@ -160,21 +255,21 @@ def cpu_intensive():
 @app.route('/api/database')
 def database_simulation():
     """Simulate database operations"""
-    app_state['request_count'] += 1
+    _count_request()
     
     # Simulate database query time
-    query_time = random.uniform(0.1, 1.0)
-    time.sleep(query_time)
+    query_time = _rng().uniform(0.1, 1.0)
+    _shutdown.wait(query_time)
     
     # Simulate occasional database connection issues
-    if random.random() < 0.08:  # 8% chance of DB issue
-        app_state['error_count'] += 1
+    if _rng().random() < 0.08:  # 8% chance of DB issue
+        _count_error()
         return jsonify({'error': 'Database connection timeout'}), 504
     
     return jsonify({
         'message': 'Database query completed',
         'query_time': query_time,
-        'records_found': random.randint(1, 100),
+        'records_found': int(_rng().integers(1, 101)),
         'timestamp': datetime.now().isoformat()
     })
 
@@ -182,6 +277,7 @@ def database_simulation():
 @app.route('/stats')
 def get_stats():
     """Get application statistics"""
+    cpu_usage, memory_usage, disk_usage = sysinfo()
     return jsonify({
         'uptime': str(datetime.now() - app_state['start_time']),
         'total_requests': app_state['request_count'],
@@ -189,9 +285,9 @@ def get_stats():
         'error_rate': app_state['error_count'] / max(app_state['request_count'], 1),
         'health_status': app_state['health_status'],
         'system_info': {
-            'cpu_usage': psutil.cpu_percent(),
-            'memory_usage': psutil.virtual_memory().percent,
-            'disk_usage': psutil.disk_usage('/').percent
+            'cpu_usage': cpu_usage,
+            'memory_usage': memory_usage,
+            'disk_usage': disk_usage
         }
     })
 
@@ -199,7 +295,7 @@ def get_stats():
 @app.errorhandler(500)
 def internal_error(error):
     """Handle internal server errors"""
-    app_state['error_count'] += 1
+    _count_error()
     return jsonify({
         'error': 'Internal server error',
         'timestamp': datetime.now().isoformat()
@@ -209,35 +305,51 @@ def internal_error(error):
 @app.errorhandler(503)
 def service_unavailable(error):
     """Handle service unavailable errors"""
-    app_state['error_count'] += 1
+    _count_error()
     return jsonify({
         'error': 'Service temporarily unavailable',
         'timestamp': datetime.now().isoformat()
     }), 503
 
 
-def background_task():
+def _handle_sigterm(signum, frame):
+    """Wake the background threads, then exit the server as SIGTERM normally would"""
+    _shutdown.set()
+    raise SystemExit(0)
+
+
+def background_task(interval: float = BACKGROUND_INTERVAL):
     """Background task that runs periodically"""
-    while True:
+    # Health recovery checks are drawn 100 at a time and consumed one per tick
+    recovery_draws = deque()
+    while not _shutdown.wait(interval):
         try:
             # Simulate background processing
-            time.sleep(30)
             logger.info(f"Background task executed. Requests served: {app_state['request_count']}")
             
             # Reset health status periodically
-            if app_state['health_status'] == 'degraded' and random.random() < 0.7:
-                app_state['health_status'] = 'healthy'
-                logger.info("Health status recovered to healthy")
+            if app_state['health_status'] == 'degraded':
+                if not recovery_draws:
+                    recovery_draws.extend(_rng().random(100) < 0.7)
+                if recovery_draws.popleft():
+                    app_state['health_status'] = 'healthy'
+                    logger.info("Health status recovered to healthy")
                 
         except Exception as e:
             logger.error(f"Background task error: {e}")
 
 
 if __name__ == '__main__':
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    
     # Start background task
     background_thread = threading.Thread(target=background_task, daemon=True)
     background_thread.start()
     
+    # Start system metrics sampler
+    sampler_thread = threading.Thread(target=metrics_sampler, daemon=True)
+    sampler_thread.start()
+    
     print("🌐 Starting Demo Web Application")
     print("Available endpoints:")
     print("  GET /                    - Home page")
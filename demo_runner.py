@@ -6,231 +6,88 @@ This script orchestrates the complete chaos engineering demonstration.
 
 import subprocess
 import time
-import threading
 import signal
+import string
+import select
+import shutil
 import sys
 import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import orjson
 
-class ChaosDemo:
-    """Orchestrates the complete chaos engineering demo"""
-    
-    def __init__(self):
-        self.processes = []
-        self.running = False
-        
-    def signal_handler(self, signum, frame):
-        """Handle Ctrl+C gracefully"""
-        print("\n🛑 Stopping Chaos Monkey Demo...")
-        self.stop_all()
-        sys.exit(0)
-    
-    def start_component(self, script_name: str, description: str, wait_time: int = 2):
-        """Start a demo component"""
-        print(f"🚀 Starting {description}...")
-        
-        try:
-            # Get the Python executable path
-            python_cmd = "/Users/kunnath/Projects/Chaos Monkey/.venv/bin/python"
-            
-            process = subprocess.Popen(
-                [python_cmd, script_name],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd="/Users/kunnath/Projects/Chaos Monkey"
-            )
-            
-            self.processes.append({
-                'process': process,
-                'name': description,
-                'script': script_name
-            })
-            
-            time.sleep(wait_time)
-            
-            # Check if process started successfully
-            if process.poll() is None:
-                print(f"✅ {description} started successfully (PID: {process.pid})")
-                return True
-            else:
-                stdout, stderr = process.communicate()
-                print(f"❌ Failed to start {description}")
-                print(f"   Error: {stderr.decode()}")
-                return False
-                
-        except Exception as e:
-            print(f"❌ Error starting {description}: {e}")
-            return False
-    
-    def stop_all(self):
-        """Stop all running components and generate final report"""
-        self.running = False
-        
-        print("\n🛑 STOPPING ALL COMPONENTS")
-        print("=" * 60)
-        
-        for component in self.processes:
-            try:
-                process = component['process']
-                name = component['name']
-                
-                if process.poll() is None:  # Process is still running
-                    print(f"🛑 Stopping {name}...")
-                    process.terminate()
-                    
-                    # Wait for graceful shutdown
-                    try:
-                        process.wait(timeout=10)  # Give more time for graceful shutdown
-                    except subprocess.TimeoutExpired:
-                        print(f"⚡ Force killing {name}...")
-                        process.kill()
-                        process.wait()
-                    
-                    print(f"✅ {name} stopped")
-                    
-            except Exception as e:
-                print(f"❌ Error stopping {component['name']}: {e}")
-        
-        self.processes.clear()
-        
-        # Generate final comprehensive report
-        print("\n📊 GENERATING FINAL REPORT")
-        print("=" * 60)
-        self._generate_final_report()
-    
-    def _generate_final_report(self):
-        """Generate comprehensive final report with all graphs and summaries"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        print("📈 Collecting and analyzing results...")
-        
-        # Check for generated files
-        monitoring_dir = "monitoring_output"
-        load_test_dir = "load_test_output"
-        
-        monitoring_files = []
-        load_test_files = []
-        
-        if os.path.exists(monitoring_dir):
-            monitoring_files = [f for f in os.listdir(monitoring_dir) if f.endswith('.png') or f.endswith('.html')]
-        
-        if os.path.exists(load_test_dir):
-            load_test_files = [f for f in os.listdir(load_test_dir) if f.endswith('.png')]
-        
-        # Generate comprehensive HTML report
-        self._create_comprehensive_report(monitoring_files, load_test_files, timestamp)
-        
-        print("\n✅ DEMO COMPLETE - FINAL RESULTS")
-        print("=" * 60)
-        print(f"📊 Demo completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        if monitoring_files or load_test_files:
-            print(f"\n📈 GENERATED VISUALIZATIONS:")
-            
-            if monitoring_files:
-                print(f"   🔍 System Monitoring:")
-                for file in sorted(monitoring_files):
-                    if file.endswith('.png'):
-                        print(f"      • {monitoring_dir}/{file}")
-                    elif file.endswith('.html'):
-                        print(f"      🌐 {monitoring_dir}/{file}")
-            
-            if load_test_files:
-                print(f"   🧪 Load Testing:")
-                for file in sorted(load_test_files):
-                    print(f"      • {load_test_dir}/{file}")
-            
-            print(f"\n🌐 COMPREHENSIVE REPORT:")
-            print(f"   📋 chaos_monkey_demo_report_{timestamp}.html")
-            
-        else:
-            print("⚠️ No visualization files found. Demo may have been stopped too early.")
-        
-        print(f"\n🎯 CHAOS ENGINEERING INSIGHTS:")
-        print(f"   • Review the graphs to identify performance impacts")
-        print(f"   • Look for correlation between chaos events and system metrics")
-        print(f"   • Analyze application resilience and recovery patterns")
-        print(f"   • Use insights to improve system robustness")
-        
-        print("\n" + "=" * 60)
-        print("🐒 Thank you for using Chaos Monkey Demo!")
-        print("=" * 60)
-    
-    def _create_comprehensive_report(self, monitoring_files, load_test_files, timestamp):
-        """Create a comprehensive HTML report combining all results"""
-        
-        monitoring_dir = "monitoring_output"
-        load_test_dir = "load_test_output"
-        
-        html_content = f"""
-<!DOCTYPE html>
+# Static parts of the comprehensive HTML report. Only the $-placeholders change between
+# runs; string.Template is used because the CSS is full of braces and percent signs.
+_REPORT_HEAD = string.Template("""<!DOCTYPE html>
 <html>
 <head>
     <title>Chaos Monkey Demo - Comprehensive Report</title>
     <meta charset="UTF-8">
     <style>
-        body {{ 
+        body { 
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             margin: 0; 
             padding: 20px; 
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 15px;
             box-shadow: 0 20px 40px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
-        .header {{ 
+        }
+        .header { 
             background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
             color: white; 
             padding: 40px 30px; 
             text-align: center; 
-        }}
-        .header h1 {{ margin: 0; font-size: 2.5em; font-weight: 300; }}
-        .header p {{ margin: 10px 0 0 0; opacity: 0.9; font-size: 1.1em; }}
-        .section {{ 
+        }
+        .header h1 { margin: 0; font-size: 2.5em; font-weight: 300; }
+        .header p { margin: 10px 0 0 0; opacity: 0.9; font-size: 1.1em; }
+        .section { 
             padding: 30px; 
             border-bottom: 1px solid #eee; 
-        }}
-        .section:last-child {{ border-bottom: none; }}
-        .section h2 {{ 
+        }
+        .section:last-child { border-bottom: none; }
+        .section h2 { 
             color: #2c3e50; 
             border-bottom: 3px solid #3498db; 
             padding-bottom: 10px; 
             margin-bottom: 25px;
             font-weight: 300;
-        }}
-        .grid {{ 
+        }
+        .grid { 
             display: grid; 
             grid-template-columns: repeat(auto-fit, minmax(350px, 1fr)); 
             gap: 25px; 
             margin-top: 25px; 
-        }}
-        .card {{ 
+        }
+        .card { 
             background: #f8f9fa; 
             padding: 25px; 
             border-radius: 10px; 
             box-shadow: 0 5px 15px rgba(0,0,0,0.08); 
             transition: transform 0.3s ease;
-        }}
-        .card:hover {{ transform: translateY(-5px); }}
-        .card h3 {{ 
+        }
+        .card:hover { transform: translateY(-5px); }
+        .card h3 { 
             margin: 0 0 15px 0; 
             color: #34495e; 
             font-weight: 500;
-        }}
-        .card img {{ 
+        }
+        .card img { 
             width: 100%; 
             height: auto; 
             border-radius: 8px; 
             box-shadow: 0 3px 10px rgba(0,0,0,0.1);
-        }}
-        .metric {{ 
+        }
+        .metric { 
             display: inline-block; 
             margin: 10px 15px; 
             padding: 20px; 
@@ -239,66 +96,66 @@ class ChaosDemo:
             text-align: center; 
             box-shadow: 0 3px 10px rgba(0,0,0,0.1);
             min-width: 120px;
-        }}
-        .metric strong {{ 
+        }
+        .metric strong { 
             display: block; 
             font-size: 1.8em; 
             color: #2c3e50; 
             margin-bottom: 5px;
-        }}
-        .metric span {{ 
+        }
+        .metric span { 
             color: #7f8c8d; 
             font-size: 0.9em;
-        }}
-        .insights {{ 
+        }
+        .insights { 
             background: linear-gradient(135deg, #74b9ff 0%, #0984e3 100%);
             color: white; 
             padding: 30px; 
             border-radius: 10px; 
             margin: 25px 0;
-        }}
-        .insights h3 {{ 
+        }
+        .insights h3 { 
             margin: 0 0 15px 0; 
             font-weight: 300;
-        }}
-        .insights ul {{ 
+        }
+        .insights ul { 
             margin: 0; 
             padding-left: 20px;
-        }}
-        .insights li {{ 
+        }
+        .insights li { 
             margin: 8px 0; 
             line-height: 1.6;
-        }}
-        .file-list {{ 
+        }
+        .file-list { 
             background: #f1f2f6; 
             padding: 20px; 
             border-radius: 8px; 
             margin: 15px 0;
-        }}
-        .file-list ul {{ 
+        }
+        .file-list ul { 
             margin: 0; 
             padding-left: 20px;
-        }}
-        .file-list li {{ 
+        }
+        .file-list li { 
             margin: 5px 0; 
             font-family: 'Courier New', monospace;
             font-size: 0.9em;
-        }}
-        .badge {{ 
+        }
+        .badge { 
             background: #3498db; 
             color: white; 
             padding: 4px 12px; 
             border-radius: 15px; 
             font-size: 0.8em; 
             margin-left: 10px;
-        }}
-        .footer {{ 
+        }
+        .footer { 
             background: #2c3e50; 
             color: white; 
             text-align: center; 
             padding: 25px;
-        }}
-        .emoji {{ font-size: 1.2em; }}
+        }
+        .emoji { font-size: 1.2em; }
     </style>
 </head>
 <body>
@@ -306,21 +163,21 @@ class ChaosDemo:
         <div class="header">
             <h1><span class="emoji">🐒</span> Chaos Monkey Demo</h1>
             <p>Comprehensive Chaos Engineering Analysis Report</p>
-            <p>Generated on {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}</p>
+            <p>Generated on $generated_on</p>
         </div>
         
         <div class="section">
             <h2><span class="emoji">📊</span> Demo Summary</h2>
             <div class="metric">
-                <strong>{len(monitoring_files) + len(load_test_files)}</strong>
+                <strong>$total_count</strong>
                 <span>Visualizations Generated</span>
             </div>
             <div class="metric">
-                <strong>{len(monitoring_files)}</strong>
+                <strong>$monitoring_count</strong>
                 <span>Monitoring Charts</span>
             </div>
             <div class="metric">
-                <strong>{len(load_test_files)}</strong>
+                <strong>$load_test_count</strong>
                 <span>Performance Charts</span>
             </div>
             <div class="metric">
@@ -333,19 +190,15 @@ class ChaosDemo:
             <h2><span class="emoji">🔍</span> System Monitoring Results</h2>
             <p>Real-time monitoring of system resources and application health during chaos experiments.</p>
             
-            <div class="grid">"""
-        
-        # Add monitoring visualizations
-        for file in sorted(monitoring_files):
-            if file.endswith('.png'):
-                title = file.replace('_', ' ').replace('.png', '').title()
-                html_content += f"""
+            <div class="grid">""")
+
+_REPORT_CARD = string.Template("""
                 <div class="card">
-                    <h3>{title}</h3>
-                    <img src="{monitoring_dir}/{file}" alt="{title}">
-                </div>"""
-        
-        html_content += """
+                    <h3>$title</h3>
+                    <img src="$src" alt="$title">
+                </div>""")
+
+_REPORT_LOAD_TEST_SECTION = """
             </div>
         </div>
         
@@ -354,36 +207,15 @@ class ChaosDemo:
             <p>Performance analysis under continuous load during chaos engineering experiments.</p>
             
             <div class="grid">"""
-        
-        # Add load testing visualizations
-        for file in sorted(load_test_files):
-            title = file.replace('_', ' ').replace('.png', '').title()
-            html_content += f"""
-            <div class="card">
-                <h3>{title}</h3>
-                <img src="{load_test_dir}/{file}" alt="{title}">
-            </div>"""
-        
-        # Create monitoring and load test file lists
-        monitoring_files_html = ""
-        if monitoring_files:
-            monitoring_files_html = f'''<div class="file-list">
-                <h4>System Monitoring Output:</h4>
-                <ul>
-                    {chr(10).join([f"<li>{monitoring_dir}/{file}</li>" for file in sorted(monitoring_files)])}
-                </ul>
-            </div>'''
-        
-        load_test_files_html = ""
-        if load_test_files:
-            load_test_files_html = f'''<div class="file-list">
-                <h4>Load Testing Output:</h4>
+
+_REPORT_FILE_LIST = string.Template('''<div class="file-list">
+                <h4>$heading</h4>
                 <ul>
-                    {chr(10).join([f"<li>{load_test_dir}/{file}</li>" for file in sorted(load_test_files)])}
+                    $items
                 </ul>
-            </div>'''
-        
-        html_content += f"""
+            </div>''')
+
+_REPORT_TAIL = string.Template("""
             </div>
         </div>
         
@@ -416,8 +248,8 @@ class ChaosDemo:
         <div class="section">
             <h2><span class="emoji">📁</span> Generated Files</h2>
             
-            {monitoring_files_html}
-            {load_test_files_html}
+            $monitoring_files_html
+            $load_test_files_html
             
             <div class="file-list">
                 <h4>Demo Components:</h4>
@@ -432,19 +264,298 @@ class ChaosDemo:
         
         <div class="footer">
             <p><span class="emoji">🐒</span> Chaos Monkey Demo - Building Resilient Systems Through Controlled Failure</p>
-            <p>Report generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p>Report generated at $generated_at</p>
         </div>
     </div>
 </body>
-</html>"""
+</html>""")
+
+# Each component's stderr log is rotated to <name>.1 once it reaches this size, so a
+# chatty child (werkzeug logs every request) uses at most twice this on disk
+STDERR_LOG_MAX_BYTES = 1 << 20
+
+
+def _drain_stderr(pipe, log_path: str):
+    """Copy a child's stderr pipe into `log_path` until EOF, keeping one rotated backup"""
+    # Unbuffered, so the log is current while the component is still running
+    log = open(log_path, "wb", buffering=0)
+    try:
+        for chunk in iter(lambda: os.read(pipe.fileno(), 65536), b""):
+            if log.tell() + len(chunk) > STDERR_LOG_MAX_BYTES:
+                log.close()
+                os.replace(log_path, log_path + ".1")
+                log = open(log_path, "wb", buffering=0)
+            log.write(chunk)
+    finally:
+        log.close()
+        pipe.close()
+
+
+class ChaosDemo:
+    """Orchestrates the complete chaos engineering demo"""
+    
+    def __init__(self):
+        self.processes = []
+        # Interpreter for the child components, resolved once: $CHAOS_PYTHON,
+        # then the project's .venv, then the interpreter running this script
+        chaos_python = os.environ.get("CHAOS_PYTHON")
+        self.python_cmd = (
+            (chaos_python and shutil.which(chaos_python))
+            or shutil.which("python", path=os.path.join(os.getcwd(), ".venv", "bin"))
+            or sys.executable
+        )
+        # (directory, suffixes) -> (directory mtime_ns, sorted file names)
+        self._dir_cache = {}
         
-        # Save the comprehensive report
+    def signal_handler(self, signum, frame):
+        """Handle Ctrl+C gracefully"""
+        print("\n🛑 Stopping Chaos Monkey Demo...")
+        self.stop_all()
+        sys.exit(0)
+    
+    def start_component(self, script_name: str, description: str, wait_time: int = 2):
+        """Start a demo component"""
+        print(f"🚀 Starting {description}...")
+        
+        try:
+            # Nothing reads the children's stdout, so discard it in the kernel. stderr
+            # is drained by a daemon thread into a size-capped per-component log, so a
+            # long-running child can't block on a full pipe or fill the disk.
+            stderr_log = f"{os.path.splitext(script_name)[0]}_stderr.log"
+            # close_fds=False and no cwd let Popen launch via posix_spawn() instead
+            # of fork()+exec(); our own fds are non-inheritable by default anyway,
+            # and the children share our working directory (checked in __main__).
+            process = subprocess.Popen(
+                [self.python_cmd, script_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                close_fds=False
+            )
+            stderr_thread = threading.Thread(
+                target=_drain_stderr, args=(process.stderr, stderr_log), daemon=True
+            )
+            stderr_thread.start()
+            
+            self.processes.append({
+                'process': process,
+                'name': description,
+                'script': script_name,
+                'stderr_log': stderr_log,
+                'stderr_thread': stderr_thread
+            })
+            
+            time.sleep(wait_time)
+            
+            # Check if process started successfully
+            if process.poll() is None:
+                print(f"✅ {description} started successfully (PID: {process.pid})")
+                return True
+            else:
+                # The pipe hits EOF once the child is gone; wait for the log to be complete
+                stderr_thread.join(timeout=1)
+                with open(stderr_log, "rb") as f:
+                    error = f.read().decode(errors='replace')
+                print(f"❌ Failed to start {description}")
+                print(f"   Error: {error}")
+                return False
+                
+        except Exception as e:
+            print(f"❌ Error starting {description}: {e}")
+            return False
+    
+    def stop_all(self):
+        """Stop all running components and generate final report"""
+        print("\n🛑 STOPPING ALL COMPONENTS")
+        print("=" * 60)
+        
+        # Signal everything first so the components shut down in parallel,
+        # then give them one shared 10s grace period rather than 10s each
+        for component in self.processes:
+            try:
+                process = component['process']
+                if process.poll() is None:  # Process is still running
+                    print(f"🛑 Stopping {component['name']}...")
+                    process.terminate()
+            except Exception as e:
+                print(f"❌ Error stopping {component['name']}: {e}")
+        
+        deadline = time.monotonic() + 10
+        for component in self.processes:
+            try:
+                process = component['process']
+                name = component['name']
+                
+                if process.returncode is None:
+                    try:
+                        process.wait(timeout=max(0.0, deadline - time.monotonic()))
+                    except subprocess.TimeoutExpired:
+                        print(f"⚡ Force killing {name}...")
+                        process.kill()
+                        process.wait()
+                    
+                    print(f"✅ {name} stopped")
+                    
+            except Exception as e:
+                print(f"❌ Error stopping {component['name']}: {e}")
+        
+        self.processes.clear()
+        
+        # Generate final comprehensive report
+        print("\n📊 GENERATING FINAL REPORT")
+        print("=" * 60)
+        self._generate_final_report()
+    
+    def _generate_final_report(self):
+        """Generate comprehensive final report with all graphs and summaries"""
+        # One clock reading for the whole report, so every timestamp in it agrees
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        completed_at = now.strftime('%Y-%m-%d %H:%M:%S')
+        
+        print("📈 Collecting and analyzing results...")
+        
+        # Check for generated files
+        monitoring_dir = "monitoring_output"
+        load_test_dir = "load_test_output"
+        
+        monitoring_files = self._list_output_files(monitoring_dir, ('.png', '.html'))
+        load_test_files = self._list_output_files(load_test_dir, ('.png',))
+        
+        # Generate comprehensive HTML report, plus a JSON manifest of the same
+        # results for tooling that doesn't want to scrape the HTML
+        self._create_comprehensive_report(monitoring_files, load_test_files, now, timestamp, completed_at)
+        self._write_report_manifest(monitoring_dir, monitoring_files, load_test_dir, load_test_files, now, timestamp)
+        
+        print("\n✅ DEMO COMPLETE - FINAL RESULTS")
+        print("=" * 60)
+        print(f"📊 Demo completed at: {completed_at}")
+        
+        if monitoring_files or load_test_files:
+            print(f"\n📈 GENERATED VISUALIZATIONS:")
+            
+            if monitoring_files:
+                print(f"   🔍 System Monitoring:")
+                for file in monitoring_files:
+                    if file.endswith('.png'):
+                        print(f"      • {monitoring_dir}/{file}")
+                    elif file.endswith('.html'):
+                        print(f"      🌐 {monitoring_dir}/{file}")
+            
+            if load_test_files:
+                print(f"   🧪 Load Testing:")
+                for file in load_test_files:
+                    print(f"      • {load_test_dir}/{file}")
+            
+            print(f"\n🌐 COMPREHENSIVE REPORT:")
+            print(f"   📋 chaos_monkey_demo_report_{timestamp}.html")
+            print(f"   🗂️ chaos_monkey_demo_report_{timestamp}.json")
+            
+        else:
+            print("⚠️ No visualization files found. Demo may have been stopped too early.")
+        
+        print(f"\n🎯 CHAOS ENGINEERING INSIGHTS:")
+        print(f"   • Review the graphs to identify performance impacts")
+        print(f"   • Look for correlation between chaos events and system metrics")
+        print(f"   • Analyze application resilience and recovery patterns")
+        print(f"   • Use insights to improve system robustness")
+        
+        print("\n" + "=" * 60)
+        print("🐒 Thank you for using Chaos Monkey Demo!")
+        print("=" * 60)
+    
+    def _list_output_files(self, directory: str, suffixes: tuple) -> list:
+        """Sorted names of the regular files in `directory` ending in one of `suffixes`
+        
+        Listings are cached against the directory's mtime, so repeated reports
+        from the interactive menu don't rescan directories that haven't changed.
+        """
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+            key = (directory, suffixes)
+            cached = self._dir_cache.get(key)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+            
+            with os.scandir(directory) as entries:
+                names = sorted(
+                    entry.name for entry in entries
+                    if entry.name.endswith(suffixes) and entry.is_file(follow_symlinks=False)
+                )
+        except OSError:
+            return []
+        
+        self._dir_cache[key] = (mtime_ns, names)
+        return names
+    
+    def _create_comprehensive_report(self, monitoring_files, load_test_files, now, timestamp, completed_at):
+        """Create a comprehensive HTML report combining all results
+        
+        Both file lists are expected to be sorted already; `timestamp` and
+        `completed_at` are `now` preformatted by the caller.
+        """
+        
+        monitoring_dir = "monitoring_output"
+        load_test_dir = "load_test_output"
+        
+        # Each section is written as soon as it is built; the 1MB buffer still
+        # batches them into a few large writes
         report_filename = f"chaos_monkey_demo_report_{timestamp}.html"
-        with open(report_filename, 'w') as f:
-            f.write(html_content)
+        with open(report_filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(_REPORT_HEAD.substitute(
+                generated_on=now.strftime('%B %d, %Y at %H:%M:%S'),
+                total_count=len(monitoring_files) + len(load_test_files),
+                monitoring_count=len(monitoring_files),
+                load_test_count=len(load_test_files)
+            ))
+            
+            # Add monitoring visualizations
+            for file in monitoring_files:
+                if file.endswith('.png'):
+                    title = file.replace('_', ' ').replace('.png', '').title()
+                    f.write(_REPORT_CARD.substitute(title=title, src=f"{monitoring_dir}/{file}"))
+            
+            f.write(_REPORT_LOAD_TEST_SECTION)
+            
+            # Add load testing visualizations
+            for file in load_test_files:
+                title = file.replace('_', ' ').replace('.png', '').title()
+                f.write(_REPORT_CARD.substitute(title=title, src=f"{load_test_dir}/{file}"))
+            
+            # Create monitoring and load test file lists
+            monitoring_files_html = ""
+            if monitoring_files:
+                monitoring_files_html = _REPORT_FILE_LIST.substitute(
+                    heading="System Monitoring Output:",
+                    items="\n".join(f"<li>{monitoring_dir}/{file}</li>" for file in monitoring_files)
+                )
+            
+            load_test_files_html = ""
+            if load_test_files:
+                load_test_files_html = _REPORT_FILE_LIST.substitute(
+                    heading="Load Testing Output:",
+                    items="\n".join(f"<li>{load_test_dir}/{file}</li>" for file in load_test_files)
+                )
+            
+            f.write(_REPORT_TAIL.substitute(
+                monitoring_files_html=monitoring_files_html,
+                load_test_files_html=load_test_files_html,
+                generated_at=completed_at
+            ))
         
         print(f"📋 Comprehensive report generated: {report_filename}")
     
+    def _write_report_manifest(self, monitoring_dir, monitoring_files, load_test_dir, load_test_files, now, timestamp):
+        """Write the report's data as a small JSON manifest next to the HTML report"""
+        manifest = {
+            'generated_at': now,
+            'monitoring_dir': monitoring_dir,
+            'monitoring_files': monitoring_files,
+            'load_test_dir': load_test_dir,
+            'load_test_files': load_test_files
+        }
+        with open(f"chaos_monkey_demo_report_{timestamp}.json", 'wb') as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    
     def check_status(self):
         """Check status of all components"""
         print("\n📊 Component Status:")
@@ -454,7 +565,7 @@ class ChaosDemo:
             process = component['process']
             name = component['name']
             
-            if process.poll() is None:
+            if self._is_alive(process):
                 print(f"✅ {name}: Running (PID: {process.pid})")
             else:
                 print(f"❌ {name}: Stopped")
@@ -468,36 +579,40 @@ class ChaosDemo:
         
         # Setup signal handler
         signal.signal(signal.SIGINT, self.signal_handler)
-        self.running = True
         
         # Phase 1: Start the demo application
         print("\n📱 PHASE 1: Starting Demo Application")
         print("-" * 40)
-        if not self.start_component("demo_app.py", "Demo Web Application", wait_time=3):
+        if not self.start_component("demo_app.py", "Demo Web Application", wait_time=0):
             print("❌ Cannot continue without the demo application")
             return
         
         # Wait for app to be fully ready
         print("⏳ Waiting for application to be ready...")
-        time.sleep(5)
+        app = self.processes[-1]['process']
+        if not self._wait_for_port("localhost", 8080, app, timeout=15):
+            print("❌ Demo application did not start accepting connections")
+            return
+        print("✅ Demo application is accepting connections")
         
-        # Phase 2: Start system monitoring
+        # Phases 2-4 are independent of each other, so start them side by side
         print("\n🔍 PHASE 2: Starting System Monitor")
-        print("-" * 40)
-        self.start_component("system_monitor.py", "System Monitor", wait_time=2)
-        
-        # Phase 3: Start load testing
-        print("\n🧪 PHASE 3: Starting Load Testing")
-        print("-" * 40)
-        self.start_component("load_tester.py", "Load Tester", wait_time=3)
-        
-        # Phase 4: Start chaos monkey
-        print("\n🐒 PHASE 4: Starting Chaos Monkey")
+        print("🧪 PHASE 3: Starting Load Testing")
+        print("🐒 PHASE 4: Starting Chaos Monkey")
         print("-" * 40)
         print("⚠️  The Chaos Monkey will start introducing failures...")
         print("    Monitor the system behavior and application resilience.")
-        time.sleep(2)
-        self.start_component("chaos_monkey.py", "Chaos Monkey", wait_time=2)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.start_component, script, description)
+                for script, description in (
+                    ("system_monitor.py", "System Monitor"),
+                    ("load_tester.py", "Load Tester"),
+                    ("chaos_monkey.py", "Chaos Monkey")
+                )
+            ]
+            for future in futures:
+                future.result()
         
         # Demo monitoring loop
         print("\n🎯 DEMO RUNNING")
@@ -510,23 +625,76 @@ class ChaosDemo:
         print("\nPress Ctrl+C to stop the demo")
         print("=" * 60)
         
+        # SIGCHLD wakes the select() below through this pipe as soon as a
+        # component exits, so the loop sleeps until something happens
+        wakeup_r, wakeup_w = os.pipe()
+        os.set_blocking(wakeup_r, False)
+        os.set_blocking(wakeup_w, False)
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+        previous_wakeup_fd = signal.set_wakeup_fd(wakeup_w)
+        
         try:
             # Monitor demo status
             status_interval = 30  # Check every 30 seconds
-            last_status_check = time.time()
+            next_status_check = time.monotonic() + status_interval
             
-            while self.running:
-                current_time = time.time()
+            # Runs until Ctrl+C, whose handler stops everything and exits
+            while True:
+                timeout = max(0.0, next_status_check - time.monotonic())
+                ready, _, _ = select.select([wakeup_r], [], [], timeout)
+                
+                if ready:
+                    os.read(wakeup_r, 512)
+                    if self._reap_exited():
+                        self.check_status()
                 
                 # Periodic status check
-                if current_time - last_status_check >= status_interval:
+                if time.monotonic() >= next_status_check:
                     self.check_status()
-                    last_status_check = current_time
-                
-                time.sleep(5)
+                    next_status_check = time.monotonic() + status_interval
                 
         except KeyboardInterrupt:
             pass  # Handled by signal handler
+        finally:
+            signal.set_wakeup_fd(previous_wakeup_fd)
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            os.close(wakeup_r)
+            os.close(wakeup_w)
+    
+    @staticmethod
+    def _is_alive(process: subprocess.Popen) -> bool:
+        """Single-syscall liveness check that leaves reaping to poll()/wait()"""
+        if process.returncode is not None:
+            return False
+        if not hasattr(os, "waitid"):
+            return process.poll() is None
+        try:
+            # WNOWAIT peeks without reaping; os.kill(pid, 0) would also "succeed" for a zombie
+            return os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT) is None
+        except ChildProcessError:
+            return False
+    
+    def _wait_for_port(self, host: str, port: int, process: subprocess.Popen, timeout: float) -> bool:
+        """Poll until `host:port` accepts TCP connections, `process` exits or `timeout` passes"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection((host, port), timeout=0.5):
+                    return True
+            except OSError:
+                if process.poll() is not None:
+                    return False
+                time.sleep(0.1)
+        return False
+    
+    def _reap_exited(self) -> bool:
+        """Drop components that have exited; returns True if any were found"""
+        exited = [c for c in self.processes if c['process'].poll() is not None]
+        for component in exited:
+            print(f"\n❌ {component['name']} exited unexpectedly (code {component['process'].returncode})")
+            print(f"   See {component['stderr_log']} for its stderr")
+            self.processes.remove(component)
+        return bool(exited)
     
     def run_interactive_demo(self):
         """Run an interactive demo where user can control components"""
@@ -548,31 +716,24 @@ class ChaosDemo:
             print("8. Launch Streamlit Dashboard")
             print("0. Exit")
             
-            choice = input("\nSelect option (0-8): ").strip()
+            print("\nSelect option (0-8): ", end="", flush=True)
+            line = sys.stdin.readline()
+            # EOF (e.g. piped input ran out) behaves like choosing Exit
+            choice = line.strip() if line else "0"
             
-            if choice == "1":
-                self.start_component("demo_app.py", "Demo Web Application")
-            elif choice == "2":
-                self.start_component("system_monitor.py", "System Monitor")
-            elif choice == "3":
-                self.start_component("load_tester.py", "Load Tester")
-            elif choice == "4":
-                self.start_component("chaos_monkey.py", "Chaos Monkey")
-            elif choice == "5":
-                self.check_status()
-            elif choice == "6":
-                self.stop_all()
-            elif choice == "7":
-                self.run_full_demo()
-                break
-            elif choice == "8":
-                self.run_streamlit_dashboard()
-            elif choice == "0":
-                self.stop_all()
-                print("👋 Goodbye!")
-                break
-            else:
+            action = _MENU_ACTIONS.get(choice)
+            if action is None:
                 print("❌ Invalid option. Please try again.")
+                continue
+            
+            action(self)
+            if choice in _MENU_EXIT_CHOICES:
+                break
+    
+    def _exit_interactive(self):
+        """Menu option 0: stop everything and leave the interactive demo"""
+        self.stop_all()
+        print("👋 Goodbye!")
     
     def run_streamlit_dashboard(self):
         """Launch the Streamlit interactive dashboard"""
@@ -586,13 +747,11 @@ class ChaosDemo:
         
         try:
             # Start the Streamlit dashboard
-            python_cmd = "/Users/kunnath/Projects/Chaos Monkey/.venv/bin/python"
-            
             dashboard_process = subprocess.run([
-                python_cmd, "-m", "streamlit", "run", "streamlit_demo.py",
+                self.python_cmd, "-m", "streamlit", "run", "streamlit_demo.py",
                 "--server.port", "8501",
                 "--browser.gatherUsageStats", "false"
-            ], cwd="/Users/kunnath/Projects/Chaos Monkey")
+            ])
             
         except KeyboardInterrupt:
             print("\n🛑 Dashboard stopped by user")
@@ -601,6 +760,22 @@ class ChaosDemo:
             print("💡 Make sure Streamlit is installed: pip install streamlit plotly pandas")
 
 
+# Interactive demo menu: choice -> action taking the ChaosDemo instance
+_MENU_ACTIONS = {
+    "1": lambda demo: demo.start_component("demo_app.py", "Demo Web Application"),
+    "2": lambda demo: demo.start_component("system_monitor.py", "System Monitor"),
+    "3": lambda demo: demo.start_component("load_tester.py", "Load Tester"),
+    "4": lambda demo: demo.start_component("chaos_monkey.py", "Chaos Monkey"),
+    "5": ChaosDemo.check_status,
+    "6": ChaosDemo.stop_all,
+    "7": ChaosDemo.run_full_demo,
+    "8": ChaosDemo.run_streamlit_dashboard,
+    "0": ChaosDemo._exit_interactive,
+}
+# Choices that end the interactive session once their action returns
+_MENU_EXIT_CHOICES = frozenset(("7", "0"))
+
+
 def show_demo_info():
     """Show information about the demo"""
     print("🐒 CHAOS MONKEY DEMO INFORMATION")
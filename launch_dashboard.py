@@ -8,31 +8,32 @@ import os
 import sys
 import subprocess
 import time
+from importlib.util import find_spec
 
 def check_dependencies():
     """Check if required dependencies are installed"""
-    try:
-        import streamlit
-        import plotly
-        import pandas
+    # find_spec only locates the packages; importing them here would cost seconds
+    # and hundreds of MB in a process that never uses them
+    missing = [name for name in ("streamlit", "plotly", "pandas") if find_spec(name) is None]
+    if not missing:
         print("✅ All dependencies are available")
         return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
-        print("🔧 Installing required packages...")
-        
-        # Install requirements
-        try:
-            subprocess.check_call([
-                sys.executable, "-m", "pip", "install", 
-                "streamlit==1.28.1", "plotly==5.17.0", "pandas==2.1.3", 
-                "numpy==1.25.2", "matplotlib==3.8.2"
-            ])
-            print("✅ Dependencies installed successfully")
-            return True
-        except subprocess.CalledProcessError:
-            print("❌ Failed to install dependencies")
-            return False
+    
+    print(f"❌ Missing dependencies: {', '.join(missing)}")
+    print("🔧 Installing required packages...")
+    
+    # Install requirements
+    try:
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install", 
+            "streamlit==1.37.1", "plotly==5.17.0", "pandas==2.1.3", 
+            "numpy==1.25.2", "matplotlib==3.8.2"
+        ])
+        print("✅ Dependencies installed successfully")
+        return True
+    except subprocess.CalledProcessError:
+        print("❌ Failed to install dependencies")
+        return False
 
 def launch_streamlit():
     """Launch the Streamlit application"""
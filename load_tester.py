@@ -5,16 +5,59 @@ This script generates load on the demo application to simulate real traffic.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import threading
 import time
-import random
 import logging
+import logging.handlers
+import atexit
+import queue
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
+import matplotlib
+matplotlib.use('Agg')  # Graphs are only saved to files, so skip loading a GUI backend
 import matplotlib.pyplot as plt
-import pandas as pd
 import numpy as np
 import os
+import sys
+import math
+
+
+# Endpoints the pacer picks per random draw
+PATH_BATCH_SIZE = 1024
+# Most recent response times each worker keeps for percentiles and the histogram;
+# count, mean, variance, min and max are tracked over every response
+RESPONSE_TIMES_CAPACITY = 1 << 16
+# Most recent response times each worker keeps per endpoint for the breakdown
+ENDPOINT_TIMES_CAPACITY = 1 << 13
+# Home the cursor and erase to the end of the screen, without spawning `clear`
+CLEAR_SCREEN = '\033[H\033[J'
+
+# Section rules for the live and final reports
+LIVE_RULE = "🧪" + "=" * 79
+FINAL_RULE = "🧪" + "=" * 78 + "🧪"
+
+# Snapshot fields plotted by _generate_load_test_graphs
+GRAPH_COLUMNS = ('elapsed', 'request_rate', 'avg_response_time', 'success_rate',
+                 'total_requests', 'successful_requests', 'failed_requests')
+
+# ANSI colours for the progress bars
+BAR_GREEN = '\033[92m'
+BAR_YELLOW = '\033[93m'
+BAR_RED = '\033[91m'
+BAR_RESET = '\033[0m'
+
+if os.name == 'nt':
+    # An empty shell command switches the Windows console into ANSI escape mode
+    os.system('')
+
+
+@functools.lru_cache(maxsize=None)
+def _bar_cells(filled: int, width: int) -> str:
+    """Bar body with `filled` of `width` cells set; there are only width + 1 of them"""
+    return '█' * filled + '▱' * (width - filled)
 
 
 class LoadTester:
@@ -22,24 +65,47 @@ class LoadTester:
     
     def __init__(self, base_url: str = "http://localhost:8080"):
         self.base_url = base_url
-        self.running = False
-        self.stats = {
-            'total_requests': 0,
-            'successful_requests': 0,
-            'failed_requests': 0,
-            'response_times': [],
-            'errors': []
-        }
+        # Set to stop the workers and the progress monitor without waiting out their pauses
+        self._stop_event = threading.Event()
+        # Set by the pacer once the warm-up is over and requests count towards the statistics
+        self._measuring = threading.Event()
+        self.stats = self._new_stats()
+        # Each worker thread records into its own stats dict; self.stats is
+        # rebuilt from them whenever a report needs it
+        self._thread_stats: List[Dict] = []
+        self._local = threading.local()
+        self._thread_stats_lock = threading.Lock()
         self.detailed_stats = []  # Store detailed metrics over time
+        
+        # One keep-alive connection pool shared by all worker threads, so requests
+        # reuse TCP connections instead of paying a handshake each time
+        self.session = requests.Session()
+        self._pool_size = 32
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=self._pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.output_dir = "load_test_output"
         
         # Create output directory
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
         
-        # Setup logging
+        # Setup logging: workers only enqueue records, and a listener thread formats
+        # and writes them to the console
         logging.basicConfig(level=logging.INFO)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+        log_queue = queue.SimpleQueue()
         self.logger = logging.getLogger(__name__)
+        self.logger.propagate = False
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                self.logger.removeHandler(handler)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        self._listener.start()
+        # The listener thread is a daemon, so flush it at exit when close() was never called
+        atexit.register(self._stop_listener)
         
         # Define endpoints to test
         self.endpoints = [
@@ -52,34 +118,130 @@ class LoadTester:
             {'path': '/api/database', 'weight': 15},
             {'path': '/stats', 'weight': 10}
         ]
+        # (endpoint id, path, full URL) triples, precomputed for _weighted_choices
+        self._targets = [(i, ep['path'], base_url + ep['path']) for i, ep in enumerate(self.endpoints)]
+        # Weights are small integers, so a table with one slot per unit of weight turns a
+        # uniform integer draw straight into an endpoint id
+        self._lookup = np.repeat(
+            np.arange(len(self.endpoints), dtype=np.intp), [ep['weight'] for ep in self.endpoints]
+        )
     
-    def _weighted_choice(self) -> str:
-        """Choose an endpoint based on weights"""
-        total_weight = sum(ep['weight'] for ep in self.endpoints)
-        rand = random.randint(1, total_weight)
-        
-        current_weight = 0
-        for endpoint in self.endpoints:
-            current_weight += endpoint['weight']
-            if rand <= current_weight:
-                return endpoint['path']
-        
-        return self.endpoints[0]['path']  # fallback
+    def _weighted_choices(self, rng: np.random.Generator, k: int) -> List[Tuple[int, str, str]]:
+        """Choose `k` endpoints based on weights, as (endpoint id, path, url) triples"""
+        targets = self._targets
+        picks = self._lookup[rng.integers(0, self._lookup.size, size=k)]
+        return [targets[i] for i in picks.tolist()]
     
-    def _make_request(self, path: str) -> Dict:
-        """Make a single HTTP request"""
-        url = f"{self.base_url}{path}"
-        start_time = time.time()
+    @staticmethod
+    def _new_stats(capacity: int = 0, endpoints: int = 0, endpoint_capacity: int = 0) -> Dict:
+        """Empty statistics: running response time moments plus a ring of recent samples
+
+        Workers record integer nanoseconds; merged snapshots hold seconds.
+        """
+        return {
+            'total_requests': 0,
+            'successful_requests': 0,
+            'failed_requests': 0,
+            'response_times': np.empty(capacity, dtype=np.int64),
+            'response_count': 0,
+            'response_mean': 0.0,
+            'response_m2': 0.0,
+            'response_min': math.inf,
+            'response_max': 0,
+            # Per-endpoint rows, indexed by endpoint id: a ring of recent samples each,
+            # with exact counts and totals for the averages
+            'endpoint_times': np.empty((endpoints, endpoint_capacity), dtype=np.int64),
+            'endpoint_counts': np.zeros(endpoints, dtype=np.int64),
+            'endpoint_sums': np.zeros(endpoints, dtype=np.int64),
+            'errors': {}  # message -> occurrences
+        }
+    
+    @staticmethod
+    def _record_response_time(stats: Dict, endpoint: int, response_ns: int):
+        """Fold a response time into the worker's running summary (Welford's algorithm)"""
+        n = stats['response_count'] + 1
+        stats['response_count'] = n
+        delta = response_ns - stats['response_mean']
+        mean = stats['response_mean'] + delta / n
+        stats['response_mean'] = mean
+        stats['response_m2'] += delta * (response_ns - mean)
+        if response_ns < stats['response_min']:
+            stats['response_min'] = response_ns
+        if response_ns > stats['response_max']:
+            stats['response_max'] = response_ns
+        times = stats['response_times']
+        times[(n - 1) % times.size] = response_ns
+        
+        counts = stats['endpoint_counts']
+        j = counts[endpoint]
+        endpoint_times = stats['endpoint_times']
+        endpoint_times[endpoint, j % endpoint_times.shape[1]] = response_ns
+        counts[endpoint] = j + 1
+        stats['endpoint_sums'][endpoint] += response_ns
+    
+    def _merge_thread_stats(self) -> Dict:
+        """Combine the per-worker statistics into one snapshot"""
+        merged = self._new_stats(endpoints=len(self.endpoints))
+        with self._thread_stats_lock:
+            thread_stats = list(self._thread_stats)
+        samples = [merged['response_times']]
+        errors = merged['errors']
+        for stats in thread_stats:
+            merged['total_requests'] += stats['total_requests']
+            merged['successful_requests'] += stats['successful_requests']
+            merged['failed_requests'] += stats['failed_requests']
+            for error, count in list(stats['errors'].items()):
+                errors[error] = errors.get(error, 0) + count
+            merged['endpoint_counts'] += stats['endpoint_counts']
+            merged['endpoint_sums'] += stats['endpoint_sums']
+            
+            n_b = stats['response_count']
+            if not n_b:
+                continue
+            # Chan et al.'s pairwise update combines the per-worker moments
+            n_a = merged['response_count']
+            n = n_a + n_b
+            delta = stats['response_mean'] - merged['response_mean']
+            merged['response_mean'] += delta * n_b / n
+            merged['response_m2'] += stats['response_m2'] + delta * delta * n_a * n_b / n
+            merged['response_count'] = n
+            merged['response_min'] = min(merged['response_min'], stats['response_min'])
+            merged['response_max'] = max(merged['response_max'], stats['response_max'])
+            times = stats['response_times']
+            samples.append(times[:min(n_b, times.size)])
+        
+        # Convert from nanoseconds to seconds for reporting
+        merged['response_times'] = np.concatenate(samples) * 1e-9
+        merged['response_mean'] *= 1e-9
+        merged['response_m2'] *= 1e-18
+        merged['response_min'] *= 1e-9
+        merged['response_max'] *= 1e-9
+        merged['endpoint_sums'] = merged['endpoint_sums'] * 1e-9
+        # Rows have different lengths once merged, so keep one array per endpoint
+        merged['endpoint_times'] = [
+            np.concatenate([
+                stats['endpoint_times'][endpoint, :min(stats['endpoint_counts'][endpoint],
+                                                       stats['endpoint_times'].shape[1])]
+                for stats in thread_stats
+            ] or [np.empty(0, dtype=np.int64)]) * 1e-9
+            for endpoint in range(len(self.endpoints))
+        ]
+        return merged
+    
+    def _make_request(self, endpoint: int, path: str, url: str, stats: Dict) -> Dict:
+        """Make a single HTTP request, recording the outcome in the worker's `stats`"""
+        start_ns = time.perf_counter_ns()
         
         try:
-            response = requests.get(url, timeout=10)
-            response_time = time.time() - start_time
+            response = self.session.get(url, timeout=10)
+            response_ns = time.perf_counter_ns() - start_ns
+            response_time = response_ns * 1e-9
             
-            self.stats['total_requests'] += 1
-            self.stats['response_times'].append(response_time)
+            stats['total_requests'] += 1
+            self._record_response_time(stats, endpoint, response_ns)
             
             if response.status_code < 400:
-                self.stats['successful_requests'] += 1
+                stats['successful_requests'] += 1
                 return {
                     'success': True,
                     'status_code': response.status_code,
@@ -87,7 +249,7 @@ class LoadTester:
                     'path': path
                 }
             else:
-                self.stats['failed_requests'] += 1
+                stats['failed_requests'] += 1
                 return {
                     'success': False,
                     'status_code': response.status_code,
@@ -97,10 +259,11 @@ class LoadTester:
                 }
                 
         except requests.exceptions.RequestException as e:
-            response_time = time.time() - start_time
-            self.stats['total_requests'] += 1
-            self.stats['failed_requests'] += 1
-            self.stats['errors'].append(str(e))
+            response_time = (time.perf_counter_ns() - start_ns) * 1e-9
+            stats['total_requests'] += 1
+            stats['failed_requests'] += 1
+            error = str(e)
+            stats['errors'][error] = stats['errors'].get(error, 0) + 1
             
             return {
                 'success': False,
@@ -109,82 +272,158 @@ class LoadTester:
                 'error': str(e)
             }
     
-    def _worker_thread(self, requests_per_second: float, duration: int):
-        """Worker thread that generates requests"""
-        thread_id = threading.current_thread().name
-        end_time = time.time() + duration
-        
-        while time.time() < end_time and self.running:
-            path = self._weighted_choice()
-            result = self._make_request(path)
-            
+    def _worker_stats(self) -> Dict:
+        """Statistics owned by the calling pool thread, registered on first use"""
+        stats = getattr(self._local, 'stats', None)
+        if stats is None:
+            stats = self._local.stats = self._new_stats(
+                RESPONSE_TIMES_CAPACITY, len(self.endpoints), ENDPOINT_TIMES_CAPACITY
+            )
+            # Looked up once per pool thread rather than on every failure
+            self._local.thread_id = threading.current_thread().name
+            with self._thread_stats_lock:
+                self._thread_stats.append(stats)
+        return stats
+    
+    def _send(self, slots: threading.BoundedSemaphore, endpoint: int, path: str, url: str,
+              measured: bool):
+        """Pool task: make one request and free its slot for the pacer"""
+        try:
+            if not measured:
+                self._warm_up(url)
+                return
+            result = self._make_request(endpoint, path, url, self._worker_stats())
             if not result['success']:
-                self.logger.warning(f"[{thread_id}] Failed request to {path}: {result.get('error')}")
-            
-            # Sleep to maintain requests per second rate
-            sleep_time = 1.0 / requests_per_second
-            time.sleep(sleep_time)
+                self.logger.warning("[%s] Failed request to %s: %s",
+                                    self._local.thread_id, path, result.get('error'))
+        finally:
+            slots.release()
+    
+    def _warm_up(self, url: str):
+        """Warm-up request: opens pooled connections and loads code paths, records nothing"""
+        try:
+            self.session.get(url, timeout=10).close()
+        except requests.exceptions.RequestException:
+            pass
+    
+    def _pacer_thread(self, pool: ThreadPoolExecutor, slots: threading.BoundedSemaphore,
+                      requests_per_second: float, warmup: float, duration: int):
+        """Issue requests to the pool on a fixed schedule, whatever the response times"""
+        # Endpoints are drawn in batches from the pacer's own generator
+        rng = np.random.default_rng()
+        targets = []
+        
+        # Requests are scheduled on a fixed grid of ticks; a slow response occupies
+        # a pool thread but never delays the next tick
+        period = 1.0 / requests_per_second
+        start_time = time.monotonic()
+        warmup_ticks = int(warmup * requests_per_second)
+        
+        for tick in range(warmup_ticks + int(duration * requests_per_second)):
+            next_tick = start_time + tick * period
+            if self._stop_event.wait(max(0.0, next_tick - time.monotonic())):
+                return
+            if tick == warmup_ticks:
+                self._measuring.set()
+            # Every slot taken means the server is falling behind; hold back until one frees
+            while not slots.acquire(timeout=0.5):
+                if self._stop_event.is_set():
+                    return
+            if not targets:
+                targets = self._weighted_choices(rng, PATH_BATCH_SIZE)
+            endpoint, path, url = targets.pop()
+            pool.submit(self._send, slots, endpoint, path, url, tick >= warmup_ticks)
     
     def start_load_test(self, 
                        requests_per_second: float = 2.0, 
                        duration: int = 300, 
-                       num_threads: int = 3):
-        """Start the load test"""
-        self.running = True
-        self.stats = {
-            'total_requests': 0,
-            'successful_requests': 0,
-            'failed_requests': 0,
-            'response_times': [],
-            'errors': []
-        }
-        
-        self.logger.info(f"🚀 Starting load test:")
-        self.logger.info(f"   Requests per second: {requests_per_second}")
-        self.logger.info(f"   Duration: {duration} seconds")
-        self.logger.info(f"   Number of threads: {num_threads}")
-        self.logger.info(f"   Target: {self.base_url}")
-        
-        # Adjust requests per second per thread
-        rps_per_thread = requests_per_second / num_threads
-        
-        # Start worker threads
-        threads = []
-        for i in range(num_threads):
-            thread = threading.Thread(
-                target=self._worker_thread,
-                args=(rps_per_thread, duration),
-                name=f"LoadWorker-{i+1}"
-            )
-            thread.start()
-            threads.append(thread)
+                       num_threads: int = 3,
+                       warmup: float = 2.0):
+        """Start the load test; `num_threads` bounds how many requests are in flight at once
+
+        Load is applied for `warmup` seconds before the measured `duration`, so connection
+        setup and other one-time costs stay out of the statistics.
+        """
+        self._stop_event.clear()
+        self._measuring.clear()
+        self.stats = self._new_stats()
+        self._thread_stats = []
+        self._local = threading.local()
+        
+        self.logger.info("🚀 Starting load test:")
+        self.logger.info("   Requests per second: %s", requests_per_second)
+        self.logger.info("   Duration: %s seconds (after %s seconds of warm-up)", duration, warmup)
+        self.logger.info("   Number of threads: %s", num_threads)
+        self.logger.info("   Target: %s", self.base_url)
+        
+        # Every worker can hold a request in flight, so make sure each gets its own
+        # pooled connection rather than queueing for one
+        if num_threads > self._pool_size:
+            self._pool_size = num_threads
+            previous = self.session.get_adapter('http://')
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=num_threads)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            previous.close()
+        
+        # One pacer feeds a pool of workers; the semaphore caps requests in flight
+        # plus requests queued behind them, so a stalled server can't pile up tickets
+        pool = ThreadPoolExecutor(max_workers=num_threads, thread_name_prefix="LoadWorker")
+        slots = threading.BoundedSemaphore(2 * num_threads)
+        pacer = threading.Thread(
+            target=self._pacer_thread,
+            args=(pool, slots, requests_per_second, warmup, duration),
+            name="LoadPacer"
+        )
+        pacer.start()
         
-        # Monitor progress
-        start_time = time.time()
         try:
-            while any(t.is_alive() for t in threads):
-                time.sleep(10)
-                elapsed = time.time() - start_time
+            # The pacer sets the measuring event on its first recorded request
+            while not self._measuring.wait(0.5):
+                if not pacer.is_alive():
+                    break
+            
+            # Monitor progress
+            start_time = time.monotonic()
+            deadline = start_time + duration
+            while pacer.is_alive():
+                # Wake for the next report, or shortly after the run is due to end
+                if self._stop_event.wait(min(10.0, max(deadline - time.monotonic(), 0.5))):
+                    break
+                elapsed = time.monotonic() - start_time
+                self.stats = self._merge_thread_stats()
                 self._print_stats(elapsed)
                 
         except KeyboardInterrupt:
             self.logger.info("🛑 Load test interrupted by user")
-            self.running = False
+            self._stop_event.set()
         
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        # Let requests already in flight finish; an interrupted run drops queued ones
+        pacer.join()
+        pool.shutdown(wait=True, cancel_futures=self._stop_event.is_set())
+        self.stats = self._merge_thread_stats()
         
         self.logger.info("✅ Load test completed")
         self._print_final_stats()
-        self._plot_results()
+    
+    def close(self):
+        """Stop any running test, release the pooled connections and flush the log"""
+        self._stop_event.set()
+        self.session.close()
+        self._stop_listener()
+    
+    def _stop_listener(self):
+        """Flush whatever is still queued, then stop the log listener thread"""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
     
     def _print_stats(self, elapsed: float):
         """Print current statistics with enhanced formatting"""
-        if self.stats['response_times']:
-            avg_response_time = sum(self.stats['response_times']) / len(self.stats['response_times'])
-            max_response_time = max(self.stats['response_times'])
-            min_response_time = min(self.stats['response_times'])
+        if self.stats['response_count']:
+            avg_response_time = self.stats['response_mean']
+            max_response_time = self.stats['response_max']
+            min_response_time = self.stats['response_min']
         else:
             avg_response_time = 0
             max_response_time = 0
@@ -192,30 +431,29 @@ class LoadTester:
         
         success_rate = (self.stats['successful_requests'] / max(self.stats['total_requests'], 1)) * 100
         
-        # Clear screen and print enhanced stats
-        os.system('clear' if os.name == 'posix' else 'cls')
-        
-        print("🧪" + "=" * 79)
-        print(f"🚀 LOAD TESTING IN PROGRESS - {datetime.now().strftime('%H:%M:%S')}")
-        print("🧪" + "=" * 79)
+        # Build the whole frame, then clear the screen and draw it in a single write
+        now = datetime.now()
+        lines = [CLEAR_SCREEN + LIVE_RULE]
+        lines.append(f"🚀 LOAD TESTING IN PROGRESS - {now:%H:%M:%S}")
+        lines.append(LIVE_RULE)
         
-        print(f"⏱️  TIMING:")
-        print(f"   Elapsed Time:     {elapsed:.1f}s")
-        print(f"   Target URL:       {self.base_url}")
+        lines.append(f"⏱️  TIMING:")
+        lines.append(f"   Elapsed Time:     {elapsed:.1f}s")
+        lines.append(f"   Target URL:       {self.base_url}")
         
-        print(f"\n📊 REQUEST STATISTICS:")
-        print(f"   Total Requests:   {self.stats['total_requests']:,}")
-        print(f"   Successful:       {self.stats['successful_requests']:,}")
-        print(f"   Failed:           {self.stats['failed_requests']:,}")
+        lines.append(f"\n📊 REQUEST STATISTICS:")
+        lines.append(f"   Total Requests:   {self.stats['total_requests']:,}")
+        lines.append(f"   Successful:       {self.stats['successful_requests']:,}")
+        lines.append(f"   Failed:           {self.stats['failed_requests']:,}")
         
         # Success rate with visual indicator
         success_bar = self._create_progress_bar(success_rate, 100)
-        print(f"   Success Rate:     {success_bar} {success_rate:.1f}%")
+        lines.append(f"   Success Rate:     {success_bar} {success_rate:.1f}%")
         
-        print(f"\n⚡ RESPONSE TIMES:")
-        print(f"   Average:          {avg_response_time*1000:.0f}ms")
-        print(f"   Minimum:          {min_response_time*1000:.0f}ms")
-        print(f"   Maximum:          {max_response_time*1000:.0f}ms")
+        lines.append(f"\n⚡ RESPONSE TIMES:")
+        lines.append(f"   Average:          {avg_response_time*1000:.0f}ms")
+        lines.append(f"   Minimum:          {min_response_time*1000:.0f}ms")
+        lines.append(f"   Maximum:          {max_response_time*1000:.0f}ms")
         
         # Performance indicator
         if avg_response_time < 0.1:
@@ -227,17 +465,17 @@ class LoadTester:
         else:
             perf_status = "🔴 Poor"
         
-        print(f"   Performance:      {perf_status}")
+        lines.append(f"   Performance:      {perf_status}")
         
         # Request rate
         if elapsed > 0:
             request_rate = self.stats['total_requests'] / elapsed
-            print(f"\n📈 THROUGHPUT:")
-            print(f"   Requests/sec:     {request_rate:.1f}")
+            lines.append(f"\n📈 THROUGHPUT:")
+            lines.append(f"   Requests/sec:     {request_rate:.1f}")
         
         # Store current stats for graphing
         self.detailed_stats.append({
-            'timestamp': datetime.now(),
+            'timestamp': now,
             'elapsed': elapsed,
             'total_requests': self.stats['total_requests'],
             'successful_requests': self.stats['successful_requests'],
@@ -247,56 +485,53 @@ class LoadTester:
             'request_rate': request_rate if elapsed > 0 else 0
         })
         
-        print("🧪" + "=" * 79)
-        print("📊 Press Ctrl+C to stop and generate final report")
-        print("🧪" + "=" * 79)
+        lines.append(LIVE_RULE)
+        lines.append("📊 Press Ctrl+C to stop and generate final report")
+        lines.append(LIVE_RULE)
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
     
     def _create_progress_bar(self, value: float, max_value: float, width: int = 20) -> str:
         """Create a visual progress bar"""
         if max_value == 0:
-            return '▱' * width
+            return _bar_cells(0, width)
         
-        filled = int((value / max_value) * width)
-        filled = min(filled, width)
+        ratio = value / max_value
+        filled = min(int(ratio * width), width)
         
         # Color coding
-        if value / max_value > 0.9:
-            color = '\033[92m'  # Green
-        elif value / max_value > 0.7:
-            color = '\033[93m'  # Yellow
+        if ratio > 0.9:
+            color = BAR_GREEN
+        elif ratio > 0.7:
+            color = BAR_YELLOW
         else:
-            color = '\033[91m'  # Red
+            color = BAR_RED
         
-        reset_color = '\033[0m'
-        bar = '█' * filled + '▱' * (width - filled)
-        return f"{color}{bar}{reset_color}"
+        return f"{color}{_bar_cells(filled, width)}{BAR_RESET}"
 
     def _print_final_stats(self):
         """Print final statistics and generate graphs"""
-        print("\n" + "🧪" + "="*78 + "🧪")
+        print("\n" + FINAL_RULE)
         print("📈 FINAL LOAD TEST RESULTS")
-        print("🧪" + "="*78 + "🧪")
-        
-        if self.stats['response_times']:
-            avg_response_time = sum(self.stats['response_times']) / len(self.stats['response_times'])
-            max_response_time = max(self.stats['response_times'])
-            min_response_time = min(self.stats['response_times'])
-            
-            # Calculate percentiles
-            sorted_times = sorted(self.stats['response_times'])
-            p50_index = int(len(sorted_times) * 0.50)
-            p90_index = int(len(sorted_times) * 0.90)
-            p95_index = int(len(sorted_times) * 0.95)
-            p99_index = int(len(sorted_times) * 0.99)
+        print(FINAL_RULE)
+        
+        response_count = self.stats['response_count']
+        if response_count:
+            avg_response_time = self.stats['response_mean']
+            max_response_time = self.stats['response_max']
+            min_response_time = self.stats['response_min']
+            std_response_time = math.sqrt(self.stats['response_m2'] / response_count)
             
-            p50_time = sorted_times[p50_index] if p50_index < len(sorted_times) else avg_response_time
-            p90_time = sorted_times[p90_index] if p90_index < len(sorted_times) else max_response_time
-            p95_time = sorted_times[p95_index] if p95_index < len(sorted_times) else max_response_time
-            p99_time = sorted_times[p99_index] if p99_index < len(sorted_times) else max_response_time
+            # Calculate percentiles over the retained samples by partial selection;
+            # 'higher' keeps reporting an observed sample as the old indexing did
+            p50_time, p90_time, p95_time, p99_time = np.percentile(
+                self.stats['response_times'], [50, 90, 95, 99], method='higher'
+            )
         else:
             avg_response_time = 0
             max_response_time = 0
             min_response_time = 0
+            std_response_time = 0
             p50_time = p90_time = p95_time = p99_time = 0
         
         success_rate = (self.stats['successful_requests'] / max(self.stats['total_requests'], 1)) * 100
@@ -312,17 +547,28 @@ class LoadTester:
         print(f"   Average:               {avg_response_time*1000:.0f}ms")
         print(f"   Minimum:               {min_response_time*1000:.0f}ms")
         print(f"   Maximum:               {max_response_time*1000:.0f}ms")
+        print(f"   Std Deviation:         {std_response_time*1000:.0f}ms")
         print(f"   50th Percentile (P50): {p50_time*1000:.0f}ms")
         print(f"   90th Percentile (P90): {p90_time*1000:.0f}ms")
         print(f"   95th Percentile (P95): {p95_time*1000:.0f}ms")
         print(f"   99th Percentile (P99): {p99_time*1000:.0f}ms")
         
+        # Per-endpoint breakdown
+        counts = self.stats['endpoint_counts']
+        if counts.any():
+            print(f"\n📍 ENDPOINT BREAKDOWN:")
+            averages = self.stats['endpoint_sums'] / np.maximum(counts, 1)
+            for endpoint, ep in enumerate(self.endpoints):
+                if not counts[endpoint]:
+                    continue
+                p95 = np.percentile(self.stats['endpoint_times'][endpoint], 95, method='higher')
+                print(f"   {ep['path']:<24} {counts[endpoint]:>7,} requests   "
+                      f"avg {averages[endpoint]*1000:>6.0f}ms   p95 {p95*1000:>6.0f}ms")
+        
         # Error analysis
         if self.stats['errors']:
             print(f"\n🚨 ERROR ANALYSIS:")
-            error_counts = {}
-            for error in self.stats['errors']:
-                error_counts[error] = error_counts.get(error, 0) + 1
+            error_counts = self.stats['errors']
             
             print(f"   Total Unique Errors:   {len(error_counts)}")
             print(f"   Top Errors:")
@@ -356,7 +602,7 @@ class LoadTester:
         print(f"\n📊 Generating performance graphs...")
         self._generate_load_test_graphs()
         
-        print("🧪" + "="*78 + "🧪")
+        print(FINAL_RULE)
     
     def _generate_load_test_graphs(self):
         """Generate load testing performance graphs"""
@@ -367,8 +613,13 @@ class LoadTester:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         try:
-            # Convert to DataFrame
-            df = pd.DataFrame(self.detailed_stats)
+            # Pull the plotted fields out of the snapshots as float columns
+            count = len(self.detailed_stats)
+            df = {
+                column: np.fromiter((snapshot[column] for snapshot in self.detailed_stats),
+                                    dtype=np.float64, count=count)
+                for column in GRAPH_COLUMNS
+            }
             
             # Create comprehensive load test dashboard
             fig, axes = plt.subplots(2, 2, figsize=(15, 10))
@@ -420,18 +671,19 @@ class LoadTester:
             plt.close()
             
             # Generate response time histogram
-            if self.stats['response_times']:
+            if self.stats['response_times'].size:
                 plt.figure(figsize=(10, 6))
-                response_times_ms = [rt * 1000 for rt in self.stats['response_times']]
-                plt.hist(response_times_ms, bins=50, alpha=0.7, color='blue', edgecolor='black')
+                response_times_ms = self.stats['response_times'] * 1000.0
+                bins = np.linspace(response_times_ms.min(), response_times_ms.max(), 51)
+                plt.hist(response_times_ms, bins=bins, alpha=0.7, color='blue', edgecolor='black')
                 plt.title('Response Time Distribution', fontsize=14, fontweight='bold')
                 plt.xlabel('Response Time (ms)')
                 plt.ylabel('Frequency')
                 plt.grid(True, alpha=0.3)
                 
                 # Add statistics to the plot
-                avg_ms = np.mean(response_times_ms)
-                p95_ms = np.percentile(response_times_ms, 95)
+                avg_ms = response_times_ms.mean()
+                p95_ms = np.percentile(response_times_ms, 95, method='higher')
                 plt.axvline(avg_ms, color='red', linestyle='--', linewidth=2, label=f'Average: {avg_ms:.0f}ms')
                 plt.axvline(p95_ms, color='orange', linestyle='--', linewidth=2, label=f'95th Percentile: {p95_ms:.0f}ms')
                 plt.legend()
@@ -447,10 +699,10 @@ class LoadTester:
         except Exception as e:
             print(f"❌ Error generating graphs: {e}")
 
-def test_connectivity():
+def test_connectivity(session: requests.Session = None):
     """Test if the demo application is running"""
     try:
-        response = requests.get("http://localhost:8080/health", timeout=5)
+        response = (session or requests).get("http://localhost:8080/health", timeout=5)
         if response.status_code == 200:
             print("✅ Demo application is running and healthy")
             return True
@@ -467,13 +719,14 @@ if __name__ == "__main__":
     print("🧪 Chaos Monkey Load Tester")
     print("=" * 50)
     
-    # Test connectivity first
-    if not test_connectivity():
-        exit(1)
-    
     # Create load tester
     tester = LoadTester()
     
+    # Test connectivity first, warming up the tester's connection pool
+    if not test_connectivity(tester.session):
+        tester.close()
+        exit(1)
+    
     # Configure test parameters
     print("\nLoad Test Configuration:")
     print("- Requests per second: 3.0")
@@ -489,3 +742,4 @@ if __name__ == "__main__":
         duration=180,  # 3 minutes
         num_threads=4
     )
+    tester.close()
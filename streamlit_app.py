@@ -5,22 +5,31 @@ Interactive web interface for chaos engineering demonstrations
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import requests
+from requests.adapters import HTTPAdapter
+import io
 import json
 import time
 import threading
+from collections import deque
 import subprocess
 import os
+import sys
+import signal
+import socket
 import psutil
 from datetime import datetime, timedelta
+from urllib.parse import urlsplit
 import numpy as np
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import logging
 
+# pandas and plotly are imported where they're used, so a cold start (and pages
+# without charts) don't pay for them
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
+
 # Configure page
 st.set_page_config(
     page_title="Chaos Monkey Demo Dashboard",
@@ -29,8 +38,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling. Streamlit drops any element a rerun doesn't
+# redraw, so main() re-sends this every run; it is built once per process here.
+CUSTOM_CSS = """
 <style>
     .main-header {
         text-align: center;
@@ -58,7 +68,176 @@ st.markdown("""
         background: #ffffff;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+HEADER_HTML = """
+<div class="main-header">
+    <h1>🐒 Chaos Monkey Demo Dashboard</h1>
+    <p>Interactive Chaos Engineering Demonstration Platform</p>
+</div>
+"""
+
+EXPERIMENT_CARD_HTML = """
+<div class="experiment-card">
+    <h4>{title}</h4>
+    <p>{description}</p>
+</div>
+"""
+CPU_STRESS_CARD = EXPERIMENT_CARD_HTML.format(
+    title="🔥 CPU Stress Test", description="Test application performance under high CPU load")
+MEMORY_PRESSURE_CARD = EXPERIMENT_CARD_HTML.format(
+    title="🧠 Memory Pressure", description="Simulate memory exhaustion scenarios")
+NETWORK_LATENCY_CARD = EXPERIMENT_CARD_HTML.format(
+    title="🌐 Network Latency", description="Introduce network delays and connectivity issues")
+
+# Component architecture for the overview page. The DOT source is a fixed constant, so
+# the browser's graphviz renderer receives an identical element on every rerun.
+ARCHITECTURE_DOT = """
+digraph {
+    "Streamlit Dashboard" -> "Demo Flask App"
+    "Streamlit Dashboard" -> "Chaos Monkey"
+    "Streamlit Dashboard" -> "Load Tester"
+    "Streamlit Dashboard" -> "System Monitor"
+    "Demo Flask App" -> "API Endpoints"
+    "Chaos Monkey" -> "Chaos Experiments"
+    "Load Tester" -> "Demo Flask App"
+    "System Monitor" -> "System Metrics"
+    "System Monitor" -> "Demo Flask App"
+}
+"""
+
+# App status is cached briefly so widget clicks and page switches don't each pay
+# an HTTP round-trip
+STATUS_TTL = 2
+# System metrics come from one background sampler shared by every session: each
+# CPU reading spans SAMPLER_INTERVAL seconds, disk usage is re-read every DISK_TTL
+SAMPLER_INTERVAL = 1.0
+DISK_TTL = 30
+# Blocking CPU sample the sampler takes at start-up, so the first reading isn't empty
+CPU_PRIME_INTERVAL = 0.1
+# TCP connect budget before committing to the HTTP health check
+PORT_PROBE_TIMEOUT = 0.2
+# How long and how often to poll the demo app after starting or stopping it
+APP_WAIT_TIMEOUT = 3
+APP_POLL_INTERVAL = 0.2
+# Simulated experiments run this many seconds, redrawing their progress bar every PROGRESS_TICK
+SIMULATED_EXPERIMENT_DURATION = 5
+PROGRESS_TICK = 0.25
+
+# Demo components the dashboard can launch, run from this script's directory
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+COMPONENT_SCRIPTS = {
+    "demo_app": "demo_app.py",
+    "load_tester": "load_tester.py",
+    "system_monitor": "system_monitor.py"
+}
+# Seconds a stopped component gets to exit before it is killed
+STOP_GRACE = 2
+
+def _signal_component(process: subprocess.Popen, sig: int):
+    """Send `sig` to a component's whole process group, or just the process where groups don't exist"""
+    if process.poll() is not None:
+        return
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass
+    else:
+        process.terminate()
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Keep-alive HTTP session shared by every dashboard session and rerun"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def _port_open(host: str, port: int, timeout: float = PORT_PROBE_TIMEOUT) -> bool:
+    """Whether something is accepting TCP connections on `host:port`"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        return sock.connect_ex((host, port)) == 0
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+@st.cache_data(ttl=STATUS_TTL, show_spinner=False)
+def fetch_app_status(base_url: str) -> Dict:
+    """Probe the demo application's health endpoint"""
+    # A refused connect answers the common "app not started" case without an HTTP timeout
+    url = urlsplit(base_url)
+    if not _port_open(url.hostname or "localhost", url.port or 80):
+        return {"status": "unreachable", "response_time": 0, "error": f"{url.netloc} is not accepting connections"}
+    
+    try:
+        # Short (connect, read) timeouts so a stalled app can't freeze the page
+        response = get_http_session().get(f"{base_url}/health", timeout=(1, 2))
+        if response.status_code == 200:
+            health_data = response.json()
+            return {
+                "status": "healthy",
+                "response_time": response.elapsed.total_seconds() * 1000,
+                "data": health_data
+            }
+        else:
+            return {"status": "degraded", "response_time": 0, "data": {}}
+    except Exception as e:
+        return {"status": "unreachable", "response_time": 0, "error": str(e)}
+
+def read_disk_usage() -> Dict:
+    """Root filesystem usage; totals barely move, so the sampler reads it less often"""
+    disk = psutil.disk_usage('/')
+    return {"used": disk.used, "total": disk.total}
+
+def sample_system_metrics(disk: Dict, cpu_interval: Optional[float] = None) -> Dict:
+    """Sample system CPU and memory usage alongside the given disk usage
+
+    With no `cpu_interval`, CPU usage is measured since the previous sample
+    instead of blocking for a fresh one.
+    """
+    cpu_percent = psutil.cpu_percent(interval=cpu_interval)
+    memory = psutil.virtual_memory()
+    
+    return {
+        "timestamp": datetime.now(),
+        "cpu_percent": cpu_percent,
+        "memory_percent": memory.percent,
+        "memory_used_gb": memory.used / (1024**3),
+        "memory_total_gb": memory.total / (1024**3),
+        "disk_percent": (disk["used"] / disk["total"]) * 100,
+        "disk_used_gb": disk["used"] / (1024**3),
+        "disk_total_gb": disk["total"] / (1024**3)
+    }
+
+@st.cache_resource
+def get_metrics_sampler() -> Dict:
+    """Start the one background thread that samples system metrics for every session
+
+    Pages read `state["latest"]` without blocking; the thread swaps in a new
+    snapshot dict every SAMPLER_INTERVAL seconds.
+    """
+    disk = read_disk_usage()
+    state = {"latest": sample_system_metrics(disk, CPU_PRIME_INTERVAL), "error": None}
+    
+    def sample_loop(disk: Dict):
+        disk_read_at = time.monotonic()
+        while True:
+            try:
+                if time.monotonic() - disk_read_at >= DISK_TTL:
+                    disk, disk_read_at = read_disk_usage(), time.monotonic()
+                state["latest"] = sample_system_metrics(disk, SAMPLER_INTERVAL)
+                state["error"] = None
+            except Exception as e:
+                state["error"] = str(e)
+                time.sleep(SAMPLER_INTERVAL)
+    
+    threading.Thread(target=sample_loop, args=(disk,), name="metrics-sampler", daemon=True).start()
+    return state
 
 class StreamlitChaosDemo:
     """Main class for the Streamlit Chaos Engineering Demo"""
@@ -72,45 +251,25 @@ class StreamlitChaosDemo:
     
     def setup_logging(self):
         """Setup logging for the demo"""
-        logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
+        if not logging.getLogger().handlers:
+            logging.basicConfig(level=logging.INFO)
     
     def check_demo_app_status(self) -> Dict:
         """Check if the demo application is running"""
-        try:
-            response = requests.get(f"{self.base_url}/health", timeout=5)
-            if response.status_code == 200:
-                health_data = response.json()
-                return {
-                    "status": "healthy",
-                    "response_time": response.elapsed.total_seconds() * 1000,
-                    "data": health_data
-                }
-            else:
-                return {"status": "degraded", "response_time": 0, "data": {}}
-        except Exception as e:
-            return {"status": "unreachable", "response_time": 0, "error": str(e)}
+        return fetch_app_status(self.base_url)
     
     def get_system_metrics(self) -> Dict:
         """Get current system metrics"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            
-            return {
-                "timestamp": datetime.now(),
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "memory_used_gb": memory.used / (1024**3),
-                "memory_total_gb": memory.total / (1024**3),
-                "disk_percent": (disk.used / disk.total) * 100,
-                "disk_used_gb": disk.used / (1024**3),
-                "disk_total_gb": disk.total / (1024**3)
-            }
+            sampler = get_metrics_sampler()
         except Exception as e:
             st.error(f"Error collecting system metrics: {e}")
             return {}
+        if sampler["error"]:
+            st.error(f"Error collecting system metrics: {sampler['error']}")
+            return {}
+        return dict(sampler["latest"])
     
     def start_component(self, component: str) -> bool:
         """Start a demo component"""
@@ -118,30 +277,21 @@ class StreamlitChaosDemo:
             if component in self.running_processes:
                 return True  # Already running
             
-            if component == "demo_app":
-                process = subprocess.Popen(
-                    ["python", "demo_app.py"],
-                    cwd="/Users/kunnath/Projects/Chaos Monkey",
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-            elif component == "load_tester":
-                process = subprocess.Popen(
-                    ["python", "load_tester.py"],
-                    cwd="/Users/kunnath/Projects/Chaos Monkey",
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-            elif component == "system_monitor":
-                process = subprocess.Popen(
-                    ["python", "system_monitor.py"],
-                    cwd="/Users/kunnath/Projects/Chaos Monkey",
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-            else:
+            script = COMPONENT_SCRIPTS.get(component)
+            if script is None:
                 return False
             
+            # Nothing reads the component's output, so don't give it a pipe it can fill and
+            # block on; its own session lets stop_component signal any grandchildren too
+            process = subprocess.Popen(
+                [sys.executable, script],
+                cwd=PROJECT_DIR,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                start_new_session=True
+            )
+            
             self.running_processes[component] = process
             return True
             
@@ -153,26 +303,268 @@ class StreamlitChaosDemo:
         """Stop a demo component"""
         if component in self.running_processes:
             try:
-                self.running_processes[component].terminate()
-                del self.running_processes[component]
+                process = self.running_processes.pop(component)
+                _signal_component(process, signal.SIGTERM)
+                try:
+                    process.wait(timeout=STOP_GRACE)
+                except subprocess.TimeoutExpired:
+                    _signal_component(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+                    process.wait()
             except Exception as e:
                 st.error(f"Error stopping {component}: {e}")
 
+# Most points a time-series trace sends to the browser
+MAX_TRACE_POINTS = 500
+# Seconds between live metric refreshes on the monitoring page
+LIVE_REFRESH_INTERVAL = 5
+# Fixed seed so the simulated history doesn't reshuffle on every rerun
+SYNTH_SEED = 42
+# Live samples each session keeps for metric deltas and the recent-trends chart
+METRICS_RING_SIZE = 60
+# Status figures kept in the cache; readings drift, so older ones are rarely reused
+STATUS_FIG_CACHE_ENTRIES = 32
+
+# Chart layouts, handed to each figure when it is built rather than patched on afterwards
+GAUGE_LAYOUT = {"height": 300, "showlegend": False}
+STATUS_LAYOUT = {"height": 600, "barmode": "group"}
+RECENT_TRENDS_LAYOUT = {
+    "height": 500,
+    "title": {"text": "Recent Performance Data"},
+    "xaxis2": {"title": {"text": "Time"}},
+    "yaxis": {"title": {"text": "Percentage"}},
+    "yaxis2": {"title": {"text": "Milliseconds"}}
+}
+SUCCESS_RATE_LAYOUT = {
+    "height": 400,
+    "title": {"text": "Experiment Success Rates (%)"},
+    "xaxis": {"title": {"text": "experiment"}},
+    "yaxis": {"title": {"text": "success_rate"}}
+}
+RESPONSE_SCATTER_LAYOUT = {
+    "height": 400,
+    "title": {"text": "Response Time vs Success Rate"},
+    "xaxis": {"title": {"text": "Avg Response Time (ms)"}},
+    "yaxis": {"title": {"text": "Success Rate (%)"}}
+}
+WEEKLY_TRENDS_LAYOUT = {"height": 600, "showlegend": False}
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of `n_out` points that keep a trace's shape"""
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    # First and last points are kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        # Keep the point spanning the largest triangle with the previous pick and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        indices[i + 1] = a
+    return indices
+
+def downsample_xy(x, y, n_out: int = MAX_TRACE_POINTS) -> Dict:
+    """`x`/`y` keyword arguments for a trace, reduced to at most `n_out` points"""
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    x_numeric = x.astype('datetime64[ns]').astype(np.int64) if np.issubdtype(x.dtype, np.datetime64) else x
+    indices = lttb_indices(x_numeric.astype(np.float64), y, n_out)
+    return {"x": x[indices], "y": y[indices]}
+
+@st.cache_data(max_entries=STATUS_FIG_CACHE_ENTRIES, show_spinner=False)
+def build_status_fig(cpu_percent: float, memory_percent: float, response_score: Optional[float] = None) -> "go.Figure":
+    """CPU and memory gauges, with the app performance bars underneath when `response_score` is given
+
+    Callers round the readings so sub-1% wiggles reuse the cached figure.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    if response_score is None:
+        fig = make_subplots(
+            rows=1, cols=2,
+            specs=[[{"type": "indicator"}, {"type": "indicator"}]],
+            subplot_titles=("CPU Usage", "Memory Usage"),
+            figure=go.Figure(layout=GAUGE_LAYOUT)
+        )
+    else:
+        fig = make_subplots(
+            rows=2, cols=2,
+            specs=[[{"type": "indicator"}, {"type": "indicator"}], [{"type": "xy", "colspan": 2}, None]],
+            subplot_titles=("CPU Usage", "Memory Usage", "Application Performance Metrics"),
+            vertical_spacing=0.15,
+            figure=go.Figure(layout=STATUS_LAYOUT)
+        )
+    
+    fig.add_trace(
+        go.Indicator(
+            mode="gauge+number",
+            value=cpu_percent,
+            domain={'x': [0, 1], 'y': [0, 1]},
+            title={'text': "CPU %"},
+            gauge={
+                'axis': {'range': [None, 100]},
+                'bar': {'color': "darkblue"},
+                'steps': [
+                    {'range': [0, 50], 'color': "lightgray"},
+                    {'range': [50, 80], 'color': "yellow"},
+                    {'range': [80, 100], 'color': "red"}
+                ],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 90
+                }
+            }
+        ),
+        row=1, col=1
+    )
+    
+    fig.add_trace(
+        go.Indicator(
+            mode="gauge+number",
+            value=memory_percent,
+            domain={'x': [0, 1], 'y': [0, 1]},
+            title={'text': "Memory %"},
+            gauge={
+                'axis': {'range': [None, 100]},
+                'bar': {'color': "darkgreen"},
+                'steps': [
+                    {'range': [0, 60], 'color': "lightgray"},
+                    {'range': [60, 85], 'color': "yellow"},
+                    {'range': [85, 100], 'color': "red"}
+                ],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 90
+                }
+            }
+        ),
+        row=1, col=2
+    )
+    
+    if response_score is None:
+        return fig
+    
+    metrics = ["Response Time", "Success Rate", "Health Score"]
+    values = [
+        response_score,
+        95,  # Simulated success rate
+        85   # Simulated health score
+    ]
+    fig.add_trace(go.Bar(x=metrics, y=values, name="Value", marker_color="#3498db"), row=2, col=1)
+    fig.add_trace(go.Bar(x=metrics, y=[50, 99, 90], name="Target", marker_color="#e74c3c"), row=2, col=1)
+    return fig
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def synth_trend_data(seed: int = SYNTH_SEED) -> "pd.DataFrame":
+    """Last week of simulated hourly averages for the analytics trends"""
+    import pandas as pd
+    
+    dates = pd.date_range(datetime.now() - timedelta(days=7), datetime.now(), freq='1h')
+    rng = np.random.default_rng(seed)
+    noise = rng.standard_normal((len(dates), 2))
+    metrics = pd.DataFrame({
+        'cpu_avg': (50 + 20 * noise[:, 0]).clip(0, 100),
+        'memory_avg': (65 + 15 * noise[:, 1]).clip(0, 100),
+        'response_time_avg': rng.exponential(200, len(dates)).clip(50, 2000),
+        'error_rate': rng.beta(2, 50, len(dates)) * 100
+    }).convert_dtypes(dtype_backend="pyarrow")
+    # Timestamps stay numpy datetime64[ns] so downsample_xy can treat them as plain integers
+    metrics.insert(0, 'timestamp', dates.astype('datetime64[ns]'))
+    return metrics
+
+# Sample experiment results; the charts read these lists directly, only the table needs a DataFrame
+EXPERIMENT_RESULTS = {
+    'experiment': ['CPU Stress', 'Memory Pressure', 'Network Latency', 'Service Hang', 'Disk I/O'],
+    'success_rate': [98.5, 96.2, 94.8, 89.3, 99.1],
+    'avg_response_time': [245, 412, 1250, 3400, 189],
+    'error_count': [12, 28, 45, 78, 8],
+    'recovery_time': [15, 32, 8, 120, 12]
+}
+# Largest marker diameter on the response-time scatter, in px
+MAX_MARKER_SIZE = 20
+
+@st.cache_data(show_spinner=False)
+def get_experiment_results() -> "pd.DataFrame":
+    """Sample results as a table for display and export"""
+    import pandas as pd
+    
+    return pd.DataFrame(EXPERIMENT_RESULTS).convert_dtypes(dtype_backend="pyarrow")
+
+@st.cache_data(show_spinner=False)
+def get_experiment_results_csv() -> bytes:
+    """Sample results encoded as CSV by pyarrow's writer"""
+    import pyarrow as pa
+    import pyarrow.csv
+    
+    buffer = io.BytesIO()
+    pyarrow.csv.write_csv(pa.Table.from_pandas(get_experiment_results(), preserve_index=False), buffer)
+    return buffer.getvalue()
+
+def gather_status(demo) -> Tuple[Dict, Dict]:
+    """Demo app status and system metrics; both are cheap cached reads, so no helper thread"""
+    return demo.check_demo_app_status(), demo.get_system_metrics()
+
+def record_sample(app_status: Dict, system_metrics: Dict) -> deque:
+    """Append the latest sample to this session's ring, skipping repeats served from the cache"""
+    ring = st.session_state.setdefault("metrics_ring", deque(maxlen=METRICS_RING_SIZE))
+    if system_metrics and (not ring or ring[-1]["timestamp"] != system_metrics["timestamp"]):
+        ring.append({
+            "timestamp": system_metrics["timestamp"],
+            "cpu_percent": system_metrics["cpu_percent"],
+            "memory_percent": system_metrics["memory_percent"],
+            "response_time": app_status["response_time"] if app_status["status"] == "healthy" else np.nan
+        })
+    return ring
+
+def ring_delta(ring: deque, key: str) -> Optional[str]:
+    """Change in `key` between the last two samples, formatted for st.metric"""
+    if len(ring) < 2:
+        return None
+    return f"{ring[-1][key] - ring[-2][key]:+.1f}%"
+
+def wait_for_app_status(demo, wanted: str, timeout: float = APP_WAIT_TIMEOUT) -> bool:
+    """Poll the demo app, bypassing the status cache, until it reports `wanted` or `timeout` passes"""
+    deadline = time.monotonic() + timeout
+    while True:
+        fetch_app_status.clear()
+        if demo.check_demo_app_status()["status"] == wanted:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(APP_POLL_INTERVAL)
+
+@st.cache_resource
+def get_demo() -> StreamlitChaosDemo:
+    """One demo controller per server, so started components are remembered across reruns"""
+    return StreamlitChaosDemo()
+
 def main():
     """Main Streamlit application"""
-    demo = StreamlitChaosDemo()
+    demo = get_demo()
+    
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
     
     # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>🐒 Chaos Monkey Demo Dashboard</h1>
-        <p>Interactive Chaos Engineering Demonstration Platform</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # Sidebar for navigation
     st.sidebar.title("🔧 Demo Controls")
     
+    # Drop the cached app status so this rerun probes it afresh; system metrics
+    # are already at most a sampler interval old
+    if st.sidebar.button("🔄 Refresh Now", key="refresh_now"):
+        fetch_app_status.clear()
+    
     # Navigation
     page = st.sidebar.selectbox(
         "Choose a section:",
@@ -222,8 +614,8 @@ def show_overview_page(demo):
     with col2:
         st.subheader("📊 System Status")
         
-        # Check demo app status
-        app_status = demo.check_demo_app_status()
+        # Check demo app status and system metrics together
+        app_status, metrics = gather_status(demo)
         if app_status["status"] == "healthy":
             st.success("✅ Demo App: Running")
         elif app_status["status"] == "degraded":
@@ -232,7 +624,6 @@ def show_overview_page(demo):
             st.error("❌ Demo App: Not Running")
         
         # System metrics
-        metrics = demo.get_system_metrics()
         if metrics:
             st.metric("💻 CPU Usage", f"{metrics['cpu_percent']:.1f}%")
             st.metric("🧠 Memory Usage", f"{metrics['memory_percent']:.1f}%")
@@ -240,18 +631,7 @@ def show_overview_page(demo):
         
         # Architecture diagram
         st.subheader("🏗️ Architecture")
-        st.mermaid("""
-        graph TD
-            A[Streamlit Dashboard] --> B[Demo Flask App]
-            A --> C[Chaos Monkey]
-            A --> D[Load Tester]
-            A --> E[System Monitor]
-            B --> F[API Endpoints]
-            C --> G[Chaos Experiments]
-            D --> B
-            E --> H[System Metrics]
-            E --> B
-        """)
+        st.graphviz_chart(ARCHITECTURE_DOT, use_container_width=True)
 
 def show_interactive_demo_page(demo):
     """Show the interactive demo page"""
@@ -267,15 +647,22 @@ def show_interactive_demo_page(demo):
         if app_status["status"] == "healthy":
             st.success("✅ Running")
             if st.button("🛑 Stop Demo App", key="stop_app"):
-                demo.stop_component("demo_app")
-                st.rerun()
+                with st.status("Stopping demo app...") as status:
+                    demo.stop_component("demo_app")
+                    if wait_for_app_status(demo, "unreachable"):
+                        status.update(label="Demo app stopped", state="complete")
+                        st.rerun()
+                    status.update(label="Demo app is still responding", state="error")
         else:
             st.error("❌ Not Running")
             if st.button("▶️ Start Demo App", key="start_app"):
                 if demo.start_component("demo_app"):
-                    st.success("Starting demo app...")
-                    time.sleep(3)
-                    st.rerun()
+                    # Poll until the app answers instead of always sleeping for its worst-case boot time
+                    with st.status("Starting demo app...") as status:
+                        if wait_for_app_status(demo, "healthy"):
+                            status.update(label="Demo app ready", state="complete")
+                            st.rerun()
+                        status.update(label="Demo app didn't report healthy in time", state="error")
         
         if app_status["status"] == "healthy":
             st.metric("Response Time", f"{app_status['response_time']:.0f}ms")
@@ -321,36 +708,21 @@ def show_interactive_demo_page(demo):
     
     with scenario_col1:
         with st.container():
-            st.markdown("""
-            <div class="experiment-card">
-                <h4>🔥 CPU Stress Test</h4>
-                <p>Test application performance under high CPU load</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(CPU_STRESS_CARD, unsafe_allow_html=True)
             
             if st.button("🚀 Run CPU Stress", key="cpu_stress"):
                 run_chaos_experiment("cpu_stress", demo)
     
     with scenario_col2:
         with st.container():
-            st.markdown("""
-            <div class="experiment-card">
-                <h4>🧠 Memory Pressure</h4>
-                <p>Simulate memory exhaustion scenarios</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(MEMORY_PRESSURE_CARD, unsafe_allow_html=True)
             
             if st.button("🚀 Run Memory Test", key="memory_stress"):
                 run_chaos_experiment("memory_stress", demo)
     
     with scenario_col3:
         with st.container():
-            st.markdown("""
-            <div class="experiment-card">
-                <h4>🌐 Network Latency</h4>
-                <p>Introduce network delays and connectivity issues</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(NETWORK_LATENCY_CARD, unsafe_allow_html=True)
             
             if st.button("🚀 Run Network Test", key="network_test"):
                 run_chaos_experiment("network_latency", demo)
@@ -377,42 +749,35 @@ def show_interactive_demo_page(demo):
             if st.button("🐌 Slow API", key="test_slow"):
                 test_endpoint("/api/slow", demo)
 
-def show_monitoring_page(demo):
-    """Show the real-time monitoring page"""
-    st.header("📊 Real-time System Monitoring")
-    
-    # Auto-refresh checkbox
-    auto_refresh = st.checkbox("🔄 Auto-refresh (5 seconds)", value=False)
-    
-    if auto_refresh:
-        time.sleep(5)
-        st.rerun()
+def show_live_metrics(demo):
+    """Show the live metrics row, gauges and recent trends on the monitoring page"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
     
     # Get current metrics
-    system_metrics = demo.get_system_metrics()
-    app_status = demo.check_demo_app_status()
+    app_status, system_metrics = gather_status(demo)
+    ring = record_sample(app_status, system_metrics)
     
     # Top metrics row
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         if system_metrics:
-            cpu_color = "normal" if system_metrics["cpu_percent"] < 70 else "inverse"
             st.metric(
                 "💻 CPU Usage", 
                 f"{system_metrics['cpu_percent']:.1f}%",
-                delta=None,
-                delta_color=cpu_color
+                delta=ring_delta(ring, "cpu_percent"),
+                delta_color="inverse"
             )
     
     with col2:
         if system_metrics:
-            mem_color = "normal" if system_metrics["memory_percent"] < 80 else "inverse"
             st.metric(
                 "🧠 Memory Usage", 
                 f"{system_metrics['memory_percent']:.1f}%",
-                delta=f"{system_metrics['memory_used_gb']:.1f}GB / {system_metrics['memory_total_gb']:.1f}GB",
-                delta_color=mem_color
+                delta=ring_delta(ring, "memory_percent"),
+                delta_color="inverse",
+                help=f"{system_metrics['memory_used_gb']:.1f}GB / {system_metrics['memory_total_gb']:.1f}GB"
             )
     
     with col3:
@@ -439,140 +804,61 @@ def show_monitoring_page(demo):
     
     # Charts
     if system_metrics:
-        # Create gauge charts for system metrics
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # CPU and Memory gauge
-            fig = make_subplots(
-                rows=1, cols=2,
-                specs=[[{"type": "indicator"}, {"type": "indicator"}]],
-                subplot_titles=("CPU Usage", "Memory Usage")
-            )
-            
-            fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=system_metrics["cpu_percent"],
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    title={'text': "CPU %"},
-                    gauge={
-                        'axis': {'range': [None, 100]},
-                        'bar': {'color': "darkblue"},
-                        'steps': [
-                            {'range': [0, 50], 'color': "lightgray"},
-                            {'range': [50, 80], 'color': "yellow"},
-                            {'range': [80, 100], 'color': "red"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 90
-                        }
-                    }
-                ),
-                row=1, col=1
-            )
-            
-            fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=system_metrics["memory_percent"],
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    title={'text': "Memory %"},
-                    gauge={
-                        'axis': {'range': [None, 100]},
-                        'bar': {'color': "darkgreen"},
-                        'steps': [
-                            {'range': [0, 60], 'color': "lightgray"},
-                            {'range': [60, 85], 'color': "yellow"},
-                            {'range': [85, 100], 'color': "red"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 90
-                        }
-                    }
-                ),
-                row=1, col=2
-            )
-            
-            fig.update_layout(height=300, showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            # Application status chart
-            if app_status["status"] == "healthy":
-                status_data = {
-                    "Metric": ["Response Time", "Success Rate", "Health Score"],
-                    "Value": [
-                        min(app_status["response_time"] / 10, 100),  # Normalize response time
-                        95,  # Simulated success rate
-                        85   # Simulated health score
-                    ],
-                    "Target": [50, 99, 90]
-                }
-                
-                df = pd.DataFrame(status_data)
-                
-                fig = px.bar(
-                    df, 
-                    x="Metric", 
-                    y=["Value", "Target"],
-                    title="Application Performance Metrics",
-                    barmode="group",
-                    color_discrete_sequence=["#3498db", "#e74c3c"]
-                )
-                fig.update_layout(height=300)
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.error("Application not responding - cannot show performance metrics")
-    
-    # Historical data simulation (if we had real historical data)
+        # Gauges and app performance bars ship as one figure
+        healthy = app_status["status"] == "healthy"
+        response_score = round(min(app_status["response_time"] / 10, 100)) if healthy else None  # Normalize response time
+        fig = build_status_fig(round(system_metrics["cpu_percent"]), round(system_metrics["memory_percent"]), response_score)
+        st.plotly_chart(fig, use_container_width=True, key="monitor_status")
+        if not healthy:
+            st.error("Application not responding - cannot show performance metrics")
+    
+    # Recent samples from this session
     st.subheader("📈 Performance Trends")
+    if len(ring) < 2:
+        st.info("Collecting samples - refresh or enable auto-refresh to build the trend")
+        return
     
-    # Generate sample historical data for demonstration
-    times = pd.date_range(datetime.now() - timedelta(hours=1), datetime.now(), freq='1min')
-    sample_data = pd.DataFrame({
-        'timestamp': times,
-        'cpu_percent': np.random.normal(45, 15, len(times)).clip(0, 100),
-        'memory_percent': np.random.normal(60, 10, len(times)).clip(0, 100),
-        'response_time': np.random.exponential(100, len(times)).clip(10, 2000)
-    })
+    timestamps = np.array([sample["timestamp"] for sample in ring], dtype='datetime64[ms]')
     
     fig = make_subplots(
         rows=2, cols=1,
         shared_xaxes=True,
         subplot_titles=("System Resources", "Application Performance"),
-        vertical_spacing=0.1
+        vertical_spacing=0.1,
+        figure=go.Figure(layout=RECENT_TRENDS_LAYOUT)
     )
     
     # System resources
     fig.add_trace(
-        go.Scatter(x=sample_data['timestamp'], y=sample_data['cpu_percent'], 
+        go.Scattergl(**downsample_xy(timestamps, [sample["cpu_percent"] for sample in ring]), 
                   name='CPU %', line=dict(color='blue')),
         row=1, col=1
     )
     fig.add_trace(
-        go.Scatter(x=sample_data['timestamp'], y=sample_data['memory_percent'], 
+        go.Scattergl(**downsample_xy(timestamps, [sample["memory_percent"] for sample in ring]), 
                   name='Memory %', line=dict(color='green')),
         row=1, col=1
     )
     
     # Application performance
     fig.add_trace(
-        go.Scatter(x=sample_data['timestamp'], y=sample_data['response_time'], 
+        go.Scattergl(**downsample_xy(timestamps, [sample["response_time"] for sample in ring]), 
                   name='Response Time (ms)', line=dict(color='red')),
         row=2, col=1
     )
     
-    fig.update_xaxes(title_text="Time", row=2, col=1)
-    fig.update_yaxes(title_text="Percentage", row=1, col=1)
-    fig.update_yaxes(title_text="Milliseconds", row=2, col=1)
+    st.plotly_chart(fig, use_container_width=True, key="monitor_trends")
+
+def show_monitoring_page(demo):
+    """Show the real-time monitoring page"""
+    st.header("📊 Real-time System Monitoring")
+    
+    # Auto-refresh checkbox
+    auto_refresh = st.checkbox("🔄 Auto-refresh (5 seconds)", value=False)
     
-    fig.update_layout(height=500, title_text="Historical Performance Data")
-    st.plotly_chart(fig, use_container_width=True)
+    # Only the live metrics fragment reruns on the timer, not the whole page
+    live_metrics = st.fragment(run_every=LIVE_REFRESH_INTERVAL if auto_refresh else None)(show_live_metrics)
+    live_metrics(demo)
 
 def show_chaos_experiments_page(demo):
     """Show the chaos experiments page"""
@@ -593,20 +879,24 @@ def show_chaos_experiments_page(demo):
         
         with col1:
             st.markdown("### CPU Stress Test")
-            cpu_duration = st.slider("Duration (seconds)", 5, 120, 30, key="cpu_duration")
-            cpu_intensity = st.slider("CPU Cores", 1, 8, 4, key="cpu_intensity")
+            with st.form("cpu_stress_form"):
+                cpu_duration = st.slider("Duration (seconds)", 5, 120, 30, key="cpu_duration")
+                cpu_intensity = st.slider("CPU Cores", 1, 8, 4, key="cpu_intensity")
+                submitted = st.form_submit_button("🚀 Run CPU Stress")
             
-            if st.button("🚀 Run CPU Stress", key="run_cpu"):
+            if submitted:
                 st.info(f"Running CPU stress for {cpu_duration}s using {cpu_intensity} cores...")
                 # Here you would call the actual chaos monkey
                 st.success("CPU stress experiment completed!")
         
         with col2:
             st.markdown("### Memory Pressure Test")
-            mem_duration = st.slider("Duration (seconds)", 5, 120, 45, key="mem_duration")
-            mem_size = st.slider("Memory Size (MB)", 100, 2000, 500, key="mem_size")
+            with st.form("memory_stress_form"):
+                mem_duration = st.slider("Duration (seconds)", 5, 120, 45, key="mem_duration")
+                mem_size = st.slider("Memory Size (MB)", 100, 2000, 500, key="mem_size")
+                submitted = st.form_submit_button("🚀 Run Memory Test")
             
-            if st.button("🚀 Run Memory Test", key="run_memory"):
+            if submitted:
                 st.info(f"Running memory pressure for {mem_duration}s using {mem_size}MB...")
                 st.success("Memory pressure experiment completed!")
     
@@ -617,19 +907,23 @@ def show_chaos_experiments_page(demo):
         
         with col1:
             st.markdown("### Network Latency")
-            latency_duration = st.slider("Duration (seconds)", 10, 300, 60, key="latency_duration")
-            latency_delay = st.slider("Latency (ms)", 50, 2000, 500, key="latency_delay")
+            with st.form("latency_form"):
+                latency_duration = st.slider("Duration (seconds)", 10, 300, 60, key="latency_duration")
+                latency_delay = st.slider("Latency (ms)", 50, 2000, 500, key="latency_delay")
+                submitted = st.form_submit_button("🚀 Add Network Latency")
             
-            if st.button("🚀 Add Network Latency", key="run_latency"):
+            if submitted:
                 st.info(f"Adding {latency_delay}ms latency for {latency_duration}s...")
                 st.success("Network latency experiment completed!")
         
         with col2:
             st.markdown("### Connection Drops")
-            drop_duration = st.slider("Duration (seconds)", 5, 60, 20, key="drop_duration")
-            drop_probability = st.slider("Drop Rate (%)", 1, 50, 10, key="drop_probability")
+            with st.form("drops_form"):
+                drop_duration = st.slider("Duration (seconds)", 5, 60, 20, key="drop_duration")
+                drop_probability = st.slider("Drop Rate (%)", 1, 50, 10, key="drop_probability")
+                submitted = st.form_submit_button("🚀 Simulate Drops")
             
-            if st.button("🚀 Simulate Drops", key="run_drops"):
+            if submitted:
                 st.info(f"Simulating {drop_probability}% connection drops for {drop_duration}s...")
                 st.success("Connection drop experiment completed!")
     
@@ -646,9 +940,11 @@ def show_chaos_experiments_page(demo):
         
         with col2:
             st.markdown("### Service Hang")
-            hang_duration = st.slider("Hang Duration (seconds)", 5, 180, 30, key="hang_duration")
+            with st.form("hang_form"):
+                hang_duration = st.slider("Hang Duration (seconds)", 5, 180, 30, key="hang_duration")
+                submitted = st.form_submit_button("🚀 Simulate Hang")
             
-            if st.button("🚀 Simulate Hang", key="run_hang"):
+            if submitted:
                 st.info(f"Simulating service hang for {hang_duration}s...")
                 st.success("Service hang experiment completed!")
     
@@ -657,24 +953,28 @@ def show_chaos_experiments_page(demo):
         
         st.markdown("Design your own chaos experiment:")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            exp_name = st.text_input("Experiment Name", "My Custom Experiment")
-            exp_type = st.selectbox(
-                "Experiment Type",
-                ["CPU Stress", "Memory Pressure", "Network Latency", "Disk I/O", "Custom Script"]
-            )
-            exp_duration = st.number_input("Duration (seconds)", 5, 600, 60)
-        
-        with col2:
-            exp_probability = st.slider("Success Probability", 0.1, 1.0, 0.8)
-            exp_parameters = st.text_area(
-                "Custom Parameters (JSON)",
-                '{"intensity": "medium", "target": "application"}'
-            )
+        # One form so filling in the fields doesn't rerun the page on every change
+        with st.form("custom_exp"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                exp_name = st.text_input("Experiment Name", "My Custom Experiment")
+                exp_type = st.selectbox(
+                    "Experiment Type",
+                    ["CPU Stress", "Memory Pressure", "Network Latency", "Disk I/O", "Custom Script"]
+                )
+                exp_duration = st.number_input("Duration (seconds)", 5, 600, 60)
+            
+            with col2:
+                exp_probability = st.slider("Success Probability", 0.1, 1.0, 0.8)
+                exp_parameters = st.text_area(
+                    "Custom Parameters (JSON)",
+                    '{"intensity": "medium", "target": "application"}'
+                )
+            
+            submitted = st.form_submit_button("💾 Save & Run Experiment")
         
-        if st.button("💾 Save & Run Experiment", key="save_custom"):
+        if submitted:
             st.success(f"Custom experiment '{exp_name}' saved and executed!")
             
             # Display experiment summary
@@ -688,95 +988,87 @@ def show_chaos_experiments_page(demo):
 
 def show_analytics_page(demo):
     """Show the analytics and results page"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
     st.header("📈 Performance Analytics & Results")
     
     # Load historical data (simulated for demo)
     st.subheader("📊 Experiment Results Summary")
     
-    # Sample experiment results
-    experiment_results = pd.DataFrame({
-        'experiment': ['CPU Stress', 'Memory Pressure', 'Network Latency', 'Service Hang', 'Disk I/O'],
-        'success_rate': [98.5, 96.2, 94.8, 89.3, 99.1],
-        'avg_response_time': [245, 412, 1250, 3400, 189],
-        'error_count': [12, 28, 45, 78, 8],
-        'recovery_time': [15, 32, 8, 120, 12]
-    })
-    
     col1, col2 = st.columns(2)
     
     with col1:
         # Success rate chart
-        fig = px.bar(
-            experiment_results, 
-            x='experiment', 
-            y='success_rate',
-            title='Experiment Success Rates (%)',
-            color='success_rate',
-            color_continuous_scale='RdYlGn'
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        fig = go.Figure(go.Bar(
+            x=EXPERIMENT_RESULTS['experiment'],
+            y=EXPERIMENT_RESULTS['success_rate'],
+            marker=dict(
+                color=EXPERIMENT_RESULTS['success_rate'],
+                colorscale='RdYlGn',
+                colorbar=dict(title='success_rate')
+            )
+        ), layout=SUCCESS_RATE_LAYOUT)
+        st.plotly_chart(fig, use_container_width=True, key="analytics_success")
     
     with col2:
         # Response time chart
-        fig = px.scatter(
-            experiment_results,
-            x='avg_response_time',
-            y='success_rate',
-            size='error_count',
-            color='recovery_time',
-            hover_name='experiment',
-            title='Response Time vs Success Rate',
-            labels={'avg_response_time': 'Avg Response Time (ms)', 'success_rate': 'Success Rate (%)'}
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        error_counts = EXPERIMENT_RESULTS['error_count']
+        fig = go.Figure(go.Scatter(
+            x=EXPERIMENT_RESULTS['avg_response_time'],
+            y=EXPERIMENT_RESULTS['success_rate'],
+            mode='markers',
+            text=EXPERIMENT_RESULTS['experiment'],
+            hovertemplate='<b>%{text}</b><br>Avg Response Time (ms)=%{x}<br>Success Rate (%)=%{y}<extra></extra>',
+            marker=dict(
+                size=error_counts,
+                sizemode='area',
+                sizeref=2 * max(error_counts) / MAX_MARKER_SIZE ** 2,
+                color=EXPERIMENT_RESULTS['recovery_time'],
+                colorbar=dict(title='recovery_time')
+            )
+        ), layout=RESPONSE_SCATTER_LAYOUT)
+        st.plotly_chart(fig, use_container_width=True, key="analytics_scatter")
     
     # Detailed results table
     st.subheader("📋 Detailed Results")
+    experiment_results = get_experiment_results()
     st.dataframe(experiment_results, use_container_width=True)
     
     # Performance trends
     st.subheader("📈 Performance Trends Over Time")
     
     # Generate time series data
-    dates = pd.date_range(datetime.now() - timedelta(days=7), datetime.now(), freq='1H')
-    trend_data = pd.DataFrame({
-        'timestamp': dates,
-        'cpu_avg': np.random.normal(50, 20, len(dates)).clip(0, 100),
-        'memory_avg': np.random.normal(65, 15, len(dates)).clip(0, 100),
-        'response_time_avg': np.random.exponential(200, len(dates)).clip(50, 2000),
-        'error_rate': np.random.beta(2, 50, len(dates)) * 100
-    })
+    trend_data = synth_trend_data()
     
     fig = make_subplots(
         rows=2, cols=2,
         subplot_titles=('CPU Usage Trend', 'Memory Usage Trend', 'Response Time Trend', 'Error Rate Trend'),
-        vertical_spacing=0.12
+        vertical_spacing=0.12,
+        figure=go.Figure(layout=WEEKLY_TRENDS_LAYOUT)
     )
     
     fig.add_trace(
-        go.Scatter(x=trend_data['timestamp'], y=trend_data['cpu_avg'], name='CPU %'),
+        go.Scattergl(**downsample_xy(trend_data['timestamp'], trend_data['cpu_avg']), name='CPU %'),
         row=1, col=1
     )
     
     fig.add_trace(
-        go.Scatter(x=trend_data['timestamp'], y=trend_data['memory_avg'], name='Memory %'),
+        go.Scattergl(**downsample_xy(trend_data['timestamp'], trend_data['memory_avg']), name='Memory %'),
         row=1, col=2
     )
     
     fig.add_trace(
-        go.Scatter(x=trend_data['timestamp'], y=trend_data['response_time_avg'], name='Response Time'),
+        go.Scattergl(**downsample_xy(trend_data['timestamp'], trend_data['response_time_avg']), name='Response Time'),
         row=2, col=1
     )
     
     fig.add_trace(
-        go.Scatter(x=trend_data['timestamp'], y=trend_data['error_rate'], name='Error Rate %'),
+        go.Scattergl(**downsample_xy(trend_data['timestamp'], trend_data['error_rate']), name='Error Rate %'),
         row=2, col=2
     )
     
-    fig.update_layout(height=600, showlegend=False)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, key="analytics_trends")
     
     # Download results
     st.subheader("💾 Export Results")
@@ -784,14 +1076,13 @@ def show_analytics_page(demo):
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if st.button("📄 Download CSV", key="download_csv"):
-            csv = experiment_results.to_csv(index=False)
-            st.download_button(
-                label="Download CSV File",
-                data=csv,
-                file_name=f"chaos_experiment_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
-            )
+        st.download_button(
+            label="📄 Download CSV",
+            data=get_experiment_results_csv(),
+            file_name=f"chaos_experiment_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            key="download_csv"
+        )
     
     with col2:
         if st.button("📊 Download Excel", key="download_excel"):
@@ -891,10 +1182,15 @@ def run_chaos_experiment(experiment_type: str, demo):
     # Here you would integrate with the actual chaos monkey
     # For now, we'll simulate the experiment
     
+    # Progress follows the wall clock in coarse ticks rather than one update per percent
     progress_bar = st.progress(0)
-    for i in range(101):
-        time.sleep(0.05)  # Simulate experiment duration
-        progress_bar.progress(i)
+    start = time.monotonic()
+    while True:
+        percent = min(100, int(100 * (time.monotonic() - start) / SIMULATED_EXPERIMENT_DURATION))
+        progress_bar.progress(percent)
+        if percent >= 100:
+            break
+        time.sleep(PROGRESS_TICK)
     
     st.success(f"{experiment_type} experiment completed successfully!")
 
@@ -902,7 +1198,7 @@ def test_endpoint(endpoint: str, demo):
     """Test a specific endpoint"""
     try:
         url = f"{demo.base_url}{endpoint}"
-        response = requests.get(url, timeout=5)
+        response = get_http_session().get(url, timeout=(1, 5))
         
         if response.status_code == 200:
             st.success(f"✅ {endpoint}: {response.status_code} - {response.elapsed.total_seconds()*1000:.0f}ms")
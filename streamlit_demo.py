@@ -10,8 +10,11 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import json
 import time
+import threading
 import subprocess
 import os
 import psutil
@@ -26,8 +29,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS and the static page copy, built once per process. Streamlit drops any
+# element a rerun doesn't redraw, so they are still sent every run.
+CUSTOM_CSS = """
 <style>
     .main-header {
         background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
@@ -49,42 +53,209 @@ st.markdown("""
         padding: 1rem;
         margin: 0.5rem 0;
     }
+    .experiment-cards {
+        display: grid;
+        grid-template-columns: 1fr 1fr 1fr;
+        gap: 1rem;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+HEADER_HTML = """
+<div class="main-header">
+    <h1>🐒 Chaos Monkey Demo Dashboard</h1>
+    <p>Interactive Chaos Engineering Demonstration Platform</p>
+</div>
+"""
+
+OVERVIEW_MD = """
+This interactive dashboard demonstrates chaos engineering principles through:
+
+### 🎯 Core Features:
+- **🌐 Demo Application**: Flask web service with multiple endpoints
+- **🐒 Chaos Monkey**: Controlled failure injection tool
+- **📊 System Monitor**: Real-time resource and performance tracking
+- **🧪 Load Tester**: Traffic generation for realistic testing
+- **📈 Analytics**: Performance analysis and visualization
+
+### 🚀 Quick Start:
+1. **Launch Demo App**: Start the target application
+2. **Monitor Resources**: Track system performance
+3. **Generate Load**: Create realistic traffic patterns
+4. **Inject Chaos**: Test resilience with controlled failures
+5. **Analyze Results**: Review performance impacts
+"""
+
+ARCHITECTURE_TEXT = """
+🌐 Dashboard → Controls all components
+📱 Demo App → Provides test endpoints
+🐒 Chaos Monkey → Runs experiments
+📊 Load Tester → Generates traffic
+🔍 Monitor → Tracks performance
+"""
 
+# The three quick-experiment cards as one grid, lined up over the button columns below them
+EXPERIMENT_CARDS_HTML = """
+<div class="experiment-cards">
+    <div class="experiment-card"><h4>🔥 CPU Stress</h4><p>High CPU load test</p></div>
+    <div class="experiment-card"><h4>🧠 Memory Test</h4><p>Memory pressure simulation</p></div>
+    <div class="experiment-card"><h4>🌐 Network Lag</h4><p>Network latency injection</p></div>
+</div>
+"""
+
+# Simulated experiments run this many seconds, redrawing their progress bar every PROGRESS_TICK
+SIMULATED_EXPERIMENT_DURATION = 2
+PROGRESS_TICK = 0.25
+
+# App status is cached briefly so every widget click doesn't pay an HTTP round-trip
+STATUS_TTL = 5
+# System metrics come from one background sampler thread; each CPU reading spans this many seconds
+SAMPLER_INTERVAL = 1.0
+# Seconds between live metric refreshes on the monitoring page
+REFRESH_INTERVAL = 5
+
+# Endpoints probed by the interactive demo page
+TEST_ENDPOINTS = ["/", "/health", "/stats", "/api/slow"]
+
+@st.cache_resource
+def get_http_session():
+    """Keep-alive HTTP session shared by every dashboard session and rerun"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=len(TEST_ENDPOINTS), max_retries=0)
+    session.mount('http://', adapter)
+    return session
+
+@st.cache_data(ttl=STATUS_TTL, show_spinner=False)
 def check_demo_app():
     """Check if demo app is running"""
     try:
-        response = requests.get("http://localhost:8080/health", timeout=3)
+        response = get_http_session().get("http://localhost:8080/health", timeout=3)
         return response.status_code == 200
     except:
         return False
 
-def get_system_metrics():
-    """Get current system metrics"""
+def sample_system_metrics(cpu_interval):
+    """Sample system metrics, with CPU usage measured over `cpu_interval` seconds"""
+    cpu = psutil.cpu_percent(interval=cpu_interval)
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage('/')
+    
+    return {
+        'cpu_percent': cpu,
+        'memory_percent': memory.percent,
+        'disk_percent': (disk.used / disk.total) * 100,
+        'memory_used_gb': memory.used / (1024**3),
+        'memory_total_gb': memory.total / (1024**3),
+        'timestamp': datetime.now()
+    }
+
+@st.cache_resource
+def get_metrics_sampler():
+    """Start the one background thread that keeps the latest system metrics for every session"""
+    state = {'metrics': None}
+    
+    def sample_loop():
+        while True:
+            try:
+                state['metrics'] = sample_system_metrics(SAMPLER_INTERVAL)
+            except Exception:
+                state['metrics'] = None
+                time.sleep(SAMPLER_INTERVAL)
+    
     try:
-        cpu = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
-        return {
-            'cpu_percent': cpu,
-            'memory_percent': memory.percent,
-            'disk_percent': (disk.used / disk.total) * 100,
-            'memory_used_gb': memory.used / (1024**3),
-            'memory_total_gb': memory.total / (1024**3)
+        # A short blocking first sample so there is something to show straight away
+        state['metrics'] = sample_system_metrics(0.1)
+    except Exception:
+        pass
+    threading.Thread(target=sample_loop, name="metrics-sampler", daemon=True).start()
+    return state
+
+def get_system_metrics():
+    """Get the latest system metrics from the background sampler"""
+    return get_metrics_sampler()['metrics']
+
+# Gauge definitions for the monitoring page; only the value changes between refreshes
+CPU_GAUGE = {
+    'title': {'text': "CPU Usage (%)"},
+    'gauge': {
+        'axis': {'range': [None, 100]},
+        'bar': {'color': "darkblue"},
+        'steps': [
+            {'range': [0, 50], 'color': "lightgray"},
+            {'range': [50, 80], 'color': "yellow"},
+            {'range': [80, 100], 'color': "red"}
+        ],
+        'threshold': {
+            'line': {'color': "red", 'width': 4},
+            'thickness': 0.75,
+            'value': 90
         }
-    except:
-        return None
+    }
+}
+MEMORY_GAUGE = {
+    'title': {'text': "Memory Usage (%)"},
+    'gauge': {
+        'axis': {'range': [None, 100]},
+        'bar': {'color': "darkgreen"},
+        'steps': [
+            {'range': [0, 60], 'color': "lightgray"},
+            {'range': [60, 85], 'color': "yellow"},
+            {'range': [85, 100], 'color': "red"}
+        ],
+        'threshold': {
+            'line': {'color': "red", 'width': 4},
+            'thickness': 0.75,
+            'value': 90
+        }
+    }
+}
+
+def session_gauge(key, spec):
+    """This session's gauge figure, built on first use; callers only update its value"""
+    if key not in st.session_state:
+        st.session_state[key] = go.Figure(
+            go.Indicator(mode="gauge+number", value=0, domain={'x': [0, 1], 'y': [0, 1]}, **spec),
+            layout={'height': 300}
+        )
+    return st.session_state[key]
+
+# Sample experiment results shown on the analytics page
+RESULTS_DATA = {
+    'Experiment': ['CPU Stress', 'Memory Test', 'Network Lag', 'Service Hang'],
+    'Success Rate (%)': [98.5, 96.2, 94.8, 89.3],
+    'Avg Response (ms)': [245, 412, 1250, 3400],
+    'Error Count': [12, 28, 45, 78],
+    'Recovery Time (s)': [15, 32, 8, 120]
+}
+
+# strftime pattern for the exported results file
+RESULTS_CSV_NAME = "chaos_results_%Y%m%d_%H%M%S.csv"
+
+@st.cache_resource
+def analytics_assets():
+    """Results table, both charts and the CSV export, built once since the sample data never changes"""
+    df = pd.DataFrame(RESULTS_DATA)
+    
+    success_fig = px.bar(
+        df, x='Experiment', y='Success Rate (%)',
+        title='Experiment Success Rates',
+        color='Success Rate (%)',
+        color_continuous_scale='RdYlGn'
+    )
+    response_fig = px.scatter(
+        df, x='Avg Response (ms)', y='Success Rate (%)',
+        size='Error Count', color='Recovery Time (s)',
+        hover_name='Experiment',
+        title='Response Time vs Success Rate'
+    )
+    
+    return df, success_fig, response_fig, df.to_csv(index=False).encode()
 
 def main():
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+    
     # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>🐒 Chaos Monkey Demo Dashboard</h1>
-        <p>Interactive Chaos Engineering Demonstration Platform</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # Sidebar
     with st.sidebar:
@@ -124,23 +295,7 @@ def show_overview():
     with col1:
         st.header("🌟 Welcome to Chaos Monkey Demo")
         
-        st.markdown("""
-        This interactive dashboard demonstrates chaos engineering principles through:
-        
-        ### 🎯 Core Features:
-        - **🌐 Demo Application**: Flask web service with multiple endpoints
-        - **🐒 Chaos Monkey**: Controlled failure injection tool
-        - **📊 System Monitor**: Real-time resource and performance tracking
-        - **🧪 Load Tester**: Traffic generation for realistic testing
-        - **📈 Analytics**: Performance analysis and visualization
-        
-        ### 🚀 Quick Start:
-        1. **Launch Demo App**: Start the target application
-        2. **Monitor Resources**: Track system performance
-        3. **Generate Load**: Create realistic traffic patterns
-        4. **Inject Chaos**: Test resilience with controlled failures
-        5. **Analyze Results**: Review performance impacts
-        """)
+        st.markdown(OVERVIEW_MD)
     
     with col2:
         st.subheader("📊 System Status")
@@ -160,13 +315,7 @@ def show_overview():
         
         # Architecture diagram
         st.subheader("🏗️ Architecture")
-        st.text("""
-        🌐 Dashboard → Controls all components
-        📱 Demo App → Provides test endpoints
-        🐒 Chaos Monkey → Runs experiments
-        📊 Load Tester → Generates traffic
-        🔍 Monitor → Tracks performance
-        """)
+        st.text(ARCHITECTURE_TEXT)
 
 def show_interactive_demo():
     """Show interactive demo controls"""
@@ -203,41 +352,21 @@ def show_interactive_demo():
     
     # Quick experiments
     st.subheader("🚀 Quick Chaos Experiments")
+    st.markdown(EXPERIMENT_CARDS_HTML, unsafe_allow_html=True)
     
     exp_col1, exp_col2, exp_col3 = st.columns(3)
     
     with exp_col1:
-        st.markdown("""
-        <div class="experiment-card">
-            <h4>🔥 CPU Stress</h4>
-            <p>High CPU load test</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
         if st.button("Run CPU Test"):
             st.info("Running CPU stress experiment...")
             st.code("python chaos_monkey.py --experiment cpu_stress")
     
     with exp_col2:
-        st.markdown("""
-        <div class="experiment-card">
-            <h4>🧠 Memory Test</h4>
-            <p>Memory pressure simulation</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
         if st.button("Run Memory Test"):
             st.info("Running memory pressure experiment...")
             st.code("python chaos_monkey.py --experiment memory_stress")
     
     with exp_col3:
-        st.markdown("""
-        <div class="experiment-card">
-            <h4>🌐 Network Lag</h4>
-            <p>Network latency injection</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
         if st.button("Run Network Test"):
             st.info("Running network latency experiment...")
             st.code("python chaos_monkey.py --experiment network_latency")
@@ -260,17 +389,12 @@ def show_interactive_demo():
         with endpoint_col4:
             if st.button("🐌 Slow API"):
                 test_endpoint("/api/slow")
+        
+        if st.button("🧪 Test All Endpoints"):
+            test_all_endpoints()
 
-def show_monitoring():
-    """Show monitoring dashboard"""
-    st.header("📊 Real-time System Monitoring")
-    
-    # Auto-refresh
-    auto_refresh = st.checkbox("🔄 Auto-refresh (5s)")
-    if auto_refresh:
-        time.sleep(5)
-        st.rerun()
-    
+def show_live_metrics():
+    """Show the current metrics and gauges on the monitoring page"""
     # Current metrics
     metrics = get_system_metrics()
     if metrics:
@@ -293,53 +417,24 @@ def show_monitoring():
         
         with col1:
             # CPU gauge
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=metrics['cpu_percent'],
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': "CPU Usage (%)"},
-                gauge={
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "darkblue"},
-                    'steps': [
-                        {'range': [0, 50], 'color': "lightgray"},
-                        {'range': [50, 80], 'color': "yellow"},
-                        {'range': [80, 100], 'color': "red"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 90
-                    }
-                }
-            ))
-            fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
+            fig = session_gauge("cpu_gauge", CPU_GAUGE)
+            fig.data[0].value = metrics['cpu_percent']
+            st.plotly_chart(fig, use_container_width=True, key="cpu_gauge_chart")
         
         with col2:
             # Memory gauge
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=metrics['memory_percent'],
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': "Memory Usage (%)"},
-                gauge={
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "darkgreen"},
-                    'steps': [
-                        {'range': [0, 60], 'color': "lightgray"},
-                        {'range': [60, 85], 'color': "yellow"},
-                        {'range': [85, 100], 'color': "red"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 90
-                    }
-                }
-            ))
-            fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
+            fig = session_gauge("memory_gauge", MEMORY_GAUGE)
+            fig.data[0].value = metrics['memory_percent']
+            st.plotly_chart(fig, use_container_width=True, key="memory_gauge_chart")
+
+def show_monitoring():
+    """Show monitoring dashboard"""
+    st.header("📊 Real-time System Monitoring")
+    
+    # Auto-refresh reruns only the live metrics fragment, not the whole page
+    auto_refresh = st.checkbox("🔄 Auto-refresh (5s)")
+    live_metrics = st.fragment(run_every=REFRESH_INTERVAL if auto_refresh else None)(show_live_metrics)
+    live_metrics()
     
     # Historical trends (simulated)
     st.subheader("📈 Performance Trends")
@@ -414,95 +509,108 @@ def show_analytics():
     """Show analytics and results"""
     st.header("📈 Performance Analytics")
     
-    # Sample experiment results
-    results_data = {
-        'Experiment': ['CPU Stress', 'Memory Test', 'Network Lag', 'Service Hang'],
-        'Success Rate (%)': [98.5, 96.2, 94.8, 89.3],
-        'Avg Response (ms)': [245, 412, 1250, 3400],
-        'Error Count': [12, 28, 45, 78],
-        'Recovery Time (s)': [15, 32, 8, 120]
-    }
-    
-    df = pd.DataFrame(results_data)
+    df, success_fig, response_fig, csv_bytes = analytics_assets()
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Success rate chart
-        fig = px.bar(
-            df, x='Experiment', y='Success Rate (%)',
-            title='Experiment Success Rates',
-            color='Success Rate (%)',
-            color_continuous_scale='RdYlGn'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(success_fig, use_container_width=True)
     
     with col2:
         # Response time vs success rate
-        fig = px.scatter(
-            df, x='Avg Response (ms)', y='Success Rate (%)',
-            size='Error Count', color='Recovery Time (s)',
-            hover_name='Experiment',
-            title='Response Time vs Success Rate'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(response_fig, use_container_width=True)
     
     # Results table
     st.subheader("📋 Detailed Results")
     st.dataframe(df, use_container_width=True)
     
     # Download results
-    if st.button("📥 Download Results CSV"):
-        csv = df.to_csv(index=False)
-        st.download_button(
-            "Download CSV",
-            csv,
-            f"chaos_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            "text/csv"
-        )
+    st.download_button(
+        "📥 Download Results CSV",
+        csv_bytes,
+        datetime.now().strftime(RESULTS_CSV_NAME),
+        "text/csv"
+    )
 
-def test_endpoint(endpoint):
-    """Test a demo app endpoint"""
+def probe_endpoint(endpoint):
+    """Request a demo app endpoint, returning the response or the exception it raised"""
     try:
-        url = f"http://localhost:8080{endpoint}"
-        response = requests.get(url, timeout=5)
-        
-        if response.status_code == 200:
-            st.success(f"✅ {endpoint}: {response.status_code} - {response.elapsed.total_seconds()*1000:.0f}ms")
-            if endpoint in ["/health", "/stats"]:
-                st.json(response.json())
-        else:
-            st.warning(f"⚠️ {endpoint}: {response.status_code}")
+        return get_http_session().get(f"http://localhost:8080{endpoint}", timeout=5)
     except Exception as e:
-        st.error(f"❌ {endpoint}: {str(e)}")
+        return e
+
+def show_endpoint_result(endpoint, result):
+    """Render the outcome of probe_endpoint"""
+    if isinstance(result, Exception):
+        st.error(f"❌ {endpoint}: {str(result)}")
+    elif result.status_code == 200:
+        st.success(f"✅ {endpoint}: {result.status_code} - {result.elapsed.total_seconds()*1000:.0f}ms")
+        if endpoint in ["/health", "/stats"]:
+            st.json(result.json())
+    else:
+        st.warning(f"⚠️ {endpoint}: {result.status_code}")
+
+def test_endpoint(endpoint):
+    """Test a demo app endpoint"""
+    show_endpoint_result(endpoint, probe_endpoint(endpoint))
+
+def test_all_endpoints():
+    """Probe every test endpoint at once, so the slowest one sets the wait rather than their sum"""
+    with ThreadPoolExecutor(max_workers=len(TEST_ENDPOINTS)) as pool:
+        results = list(pool.map(probe_endpoint, TEST_ENDPOINTS))
+    for endpoint, result in zip(TEST_ENDPOINTS, results):
+        show_endpoint_result(endpoint, result)
 
 def run_experiment(name, duration, params):
     """Simulate running an experiment"""
     st.info(f"🧪 Running {name} experiment...")
     
+    # Progress follows the wall clock in coarse ticks rather than one update per percent
     progress = st.progress(0)
-    for i in range(101):
-        time.sleep(0.02)
-        progress.progress(i)
-    
-    st.success(f"✅ {name} experiment completed!")
+    start = time.monotonic()
+    while True:
+        percent = min(100, int(100 * (time.monotonic() - start) / SIMULATED_EXPERIMENT_DURATION))
+        progress.progress(percent)
+        if percent >= 100:
+            break
+        time.sleep(PROGRESS_TICK)
+    
+    finished_at = datetime.now()
+    st.success(f"✅ {name} experiment completed at {finished_at:%H:%M:%S}!")
     st.json({
         "experiment": name,
         "duration": duration,
         "parameters": params,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": finished_at.isoformat()
     })
 
-def generate_sample_trends():
-    """Generate sample performance trend charts"""
-    # Create sample time series data
-    times = pd.date_range(datetime.now() - timedelta(hours=1), datetime.now(), freq='5min')
-    data = pd.DataFrame({
+@st.cache_data(ttl=60, show_spinner=False)
+def sample_trend_data():
+    """Last hour of simulated metrics at 5 minute steps, regenerated at most once a minute"""
+    now = datetime.now()
+    times = pd.date_range(now - timedelta(hours=1), now, freq='5min')
+    rng = np.random.default_rng()
+    
+    # One float32 buffer, a row per series: normal draws for cpu/memory, exponential for response time
+    values = np.empty((3, len(times)), dtype=np.float32)
+    rng.standard_normal((2, len(times)), dtype=np.float32, out=values[:2])
+    values[:2] *= np.array([[15], [10]], dtype=np.float32)
+    values[:2] += np.array([[50], [65]], dtype=np.float32)
+    np.clip(values[:2], 0, 100, out=values[:2])
+    values[2] = rng.exponential(200, len(times))
+    np.clip(values[2], 50, 2000, out=values[2])
+    
+    return pd.DataFrame({
         'timestamp': times,
-        'cpu': np.random.normal(50, 15, len(times)).clip(0, 100),
-        'memory': np.random.normal(65, 10, len(times)).clip(0, 100),
-        'response_time': np.random.exponential(200, len(times)).clip(50, 2000)
+        'cpu': values[0],
+        'memory': values[1],
+        'response_time': values[2]
     })
+
+def generate_sample_trends():
+    """Generate sample performance trend charts"""
+    data = sample_trend_data()
     
     fig = make_subplots(
         rows=2, cols=1,